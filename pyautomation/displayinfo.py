@@ -19,6 +19,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
 import sys
+from typing import List
 
 class DisplayInfo():
     def __init__(self):
@@ -36,6 +37,10 @@ class DisplayInfo():
             self.is_app_generated = True
         return self.app
 
+    def get_running_Qapp(self):
+        """The QApplication the program already created, or None. Never creates one."""
+        return QApplication.instance()
+
     def get_scale_factor(self, app):
         screens = app.screens()
         for i, screen in enumerate(screens):
@@ -70,6 +75,34 @@ class DisplayInfo():
             sct.shot()
 
 
+def windows_scale_factors() -> List[float]:
+    """Per-monitor scale factors from GetDpiForMonitor, in EnumDisplayMonitors order (the mss order).
+
+    Unlike Qt, this needs no QApplication and can be called from any thread.
+    """
+    import ctypes
+    import ctypes.wintypes
+
+    MDT_EFFECTIVE_DPI = 0
+    MonitorEnumProc = ctypes.WINFUNCTYPE(
+        ctypes.c_int, ctypes.wintypes.HMONITOR, ctypes.wintypes.HDC, ctypes.POINTER(ctypes.wintypes.RECT), ctypes.wintypes.LPARAM
+    )
+    # Per-monitor DPI awareness, as mss sets it; without it every monitor reports 96.
+    ctypes.windll.shcore.SetProcessDpiAwareness(2)
+
+    factors = []
+
+    def callback(monitor, dc, rect, data):
+        dpi_x, dpi_y = ctypes.wintypes.UINT(), ctypes.wintypes.UINT()
+        if ctypes.windll.shcore.GetDpiForMonitor(monitor, MDT_EFFECTIVE_DPI, ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+            factors.append(dpi_x.value / 96.0)  # Based on Windows' standard DPI of 96
+        else:
+            factors.append(1.0)
+        return 1
+
+    ctypes.windll.user32.EnumDisplayMonitors(None, None, MonitorEnumProc(callback), 0)
+    return factors
+
 
 # if __name__ == "__main__":
 #     dis = DisplayInfo()
@@ -0,0 +1,240 @@
+"""
+pyautomation for Python 3.
+Author: iamtony.ca@gmail.com
+Source: https://github.com/changgwak/python-automation
+
+Frame sources for pyautovision: stand-ins for an ``mss`` handle that serve recorded frames.
+A session captured once with RecordingSource can be replayed through ImageMatcher at full
+speed, without a display, to measure throughput and compare detectors.
+
+pyautomation is shared under the MIT Licene.
+This means that the code can be freely copied and distributed, and costs nothing to use.
+"""
+
+
+import cv2
+import numpy as np
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from .modules.mss.screenshot import ScreenShot
+
+ARCHIVE_VERSION = 1
+ARCHIVE_INDEX = 'index.json'
+ARCHIVE_FRAMES = 'frames.bin'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+class FrameSourceExhausted(Exception):
+    """Raised by ``grab`` when a replay source has no frames left."""
+
+
+class FrameSource(metaclass=ABCMeta):
+    """The part of the ``mss`` handle that ImageMatcher uses: ``monitors``, ``grab`` and ``close``.
+
+    Assign an instance to ``ImageMatcher.sct`` (or set ``frame_source`` in the config) and every
+    capture takes the next frame. ``grab(region)`` returns a copy of the requested global region
+    of it. Subclasses provide ``__len__`` and ``frame``. Grabs may come from several threads.
+    """
+
+    def __init__(self, monitors: List[Dict[str, int]], loop: bool = False, scale_factors: Optional[List[float]] = None):
+        self.monitors = monitors
+        self.loop = loop
+        #: Per-monitor DPI scale factors of the recorded displays; monitors without one count as 1.0.
+        self.scale_factors = list(scale_factors or [])
+        self.position = 0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of frames in the source."""
+
+    @abstractmethod
+    def frame(self, index: int) -> np.ndarray:
+        """Frame ``index`` as a BGRA array."""
+
+    def frame_region(self, index: int) -> Dict[str, int]:
+        """Global region covered by frame ``index``."""
+        return self.monitors[0]
+
+    def grab(self, region: Dict[str, int]) -> ScreenShot:
+        with self._lock:
+            if self.position >= len(self):
+                if not self.loop or not len(self):
+                    raise FrameSourceExhausted(f"No frames left after {self.position}")
+                self.position = 0
+            index = self.position
+            self.position += 1
+
+            bounds = self.frame_region(index)
+            x, y = region['left'] - bounds['left'], region['top'] - bounds['top']
+            if x < 0 or y < 0 or x + region['width'] > bounds['width'] or y + region['height'] > bounds['height']:
+                raise ValueError(f"Region {region} is outside recorded frame {index} {bounds}")
+            # Always a copy, made under the lock: frame() may return a buffer the next grab reuses.
+            bgra = np.array(self.frame(index)[y:y + region['height'], x:x + region['width']], order='C')
+        return ScreenShot(memoryview(bgra).cast('B'), region)
+
+    def rewind(self) -> None:
+        self.position = 0
+
+    def close(self) -> None:
+        pass
+
+
+class PngDirectorySource(FrameSource):
+    """Replays the images of a directory in name order, each one a whole monitor at (0, 0)."""
+
+    def __init__(self, directory: str, loop: bool = False):
+        self.paths = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.paths:
+            raise FileNotFoundError(f"No images found in {directory}")
+        height, width = self.read(self.paths[0]).shape[:2]
+        monitor = {'left': 0, 'top': 0, 'width': width, 'height': height}
+        super().__init__([dict(monitor), dict(monitor)], loop)
+
+    @staticmethod
+    def read(path: str) -> np.ndarray:
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            raise FileNotFoundError(f"Image not found at path: {path}")
+        if image.ndim == 2:
+            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGRA)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2BGRA) if image.shape[2] == 3 else image
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def frame(self, index: int) -> np.ndarray:
+        return self.read(self.paths[index])
+
+
+class ArchiveSource(FrameSource):
+    """Replays a frame archive written by FrameRecorder, memory-mapped so frames are never copied in.
+
+    An archive is a directory holding ``frames.bin`` (raw pixels, gray or BGRA) and
+    ``index.json`` (monitors, their scale factors, and per frame its byte offset, region and
+    timestamp).
+    """
+
+    def __init__(self, path: str, loop: bool = False):
+        with open(os.path.join(path, ARCHIVE_INDEX)) as f:
+            index = json.load(f)
+        if index.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported frame archive version {index.get('version')} in {path}")
+        self.channels: int = index['channels']
+        self.frames: List[Dict[str, Any]] = index['frames']
+        frames_path = os.path.join(path, ARCHIVE_FRAMES)
+        self.data = np.memmap(frames_path, np.uint8, mode='r') if os.path.getsize(frames_path) else np.empty(0, np.uint8)
+        self._bgra: Optional[np.ndarray] = None
+        super().__init__(index['monitors'], loop, index.get('scale_factors'))
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def frame_region(self, index: int) -> Dict[str, int]:
+        return self.frames[index]['region']
+
+    def frame(self, index: int) -> np.ndarray:
+        entry = self.frames[index]
+        height, width = entry['region']['height'], entry['region']['width']
+        size = height * width * self.channels
+        pixels = self.data[entry['offset']:entry['offset'] + size]
+        if self.channels == 4:
+            return pixels.reshape(height, width, 4)
+        if self._bgra is None or self._bgra.shape[:2] != (height, width):
+            self._bgra = np.empty((height, width, 4), np.uint8)
+        return cv2.cvtColor(pixels.reshape(height, width), cv2.COLOR_GRAY2BGRA, dst=self._bgra)
+
+    def timestamps(self) -> List[float]:
+        return [entry['timestamp'] for entry in self.frames]
+
+    def close(self) -> None:
+        self.data = np.empty(0, np.uint8)
+
+
+class FrameRecorder:
+    """Appends frames to an archive readable by ArchiveSource.
+
+    Frames are stored gray by default (``color=True`` keeps BGRA), which is all the matcher
+    uses and a quarter of the size. A frame identical to the previous one is stored once and
+    only indexed again, so mostly static sessions stay small.
+    """
+
+    def __init__(
+        self, path: str, monitors: List[Dict[str, int]], color: bool = False, scale_factors: Optional[List[float]] = None
+    ):
+        self.path = path
+        self.monitors = [dict(m) for m in monitors]
+        self.scale_factors = list(scale_factors or [])
+        self.channels = 4 if color else 1
+        self.frames: List[Dict[str, Any]] = []
+        self._last_digest: Optional[str] = None
+        os.makedirs(path, exist_ok=True)
+        self._file = open(os.path.join(path, ARCHIVE_FRAMES), 'wb')
+        self._offset = 0
+
+    def add(self, bgra: np.ndarray, region: Dict[str, int], timestamp: Optional[float] = None) -> None:
+        pixels = bgra if self.channels == 4 else cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
+        pixels = np.ascontiguousarray(pixels)
+        region = {k: int(region[k]) for k in ('left', 'top', 'width', 'height')}
+        digest = hashlib.sha1(pixels).hexdigest() + repr(sorted(region.items()))
+        if digest != self._last_digest:
+            self._file.write(memoryview(pixels).cast('B'))
+            offset, self._offset = self._offset, self._offset + pixels.nbytes
+            self._last_digest = digest
+        else:
+            offset = self.frames[-1]['offset']
+        self.frames.append({'offset': offset, 'region': region, 'timestamp': time.time() if timestamp is None else timestamp})
+
+    def close(self) -> None:
+        """Flush the pixels and write the index; the archive is only readable after this."""
+        if self._file.closed:
+            return
+        self._file.close()
+        index = {
+            'version': ARCHIVE_VERSION, 'channels': self.channels, 'monitors': self.monitors,
+            'scale_factors': self.scale_factors, 'frames': self.frames,
+        }
+        tmp_path = os.path.join(self.path, f"{ARCHIVE_INDEX}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(self.path, ARCHIVE_INDEX))
+        logging.info(f"Frame archive {self.path}: {len(self.frames)} frames, {self._offset} bytes")
+
+
+class RecordingSource:
+    """Wraps a live ``mss`` handle (or any source) and records every grab into a FrameRecorder.
+
+    Pass the displays' ``scale_factors`` so replays choose the same template variants.
+    """
+
+    def __init__(self, inner: Any, path: str, color: bool = False, scale_factors: Optional[List[float]] = None):
+        self.inner = inner
+        self.monitors = inner.monitors
+        self.recorder = FrameRecorder(path, inner.monitors, color, scale_factors)
+
+    def grab(self, region: Dict[str, int]) -> Any:
+        screenshot = self.inner.grab(region)
+        self.recorder.add(np.asarray(screenshot), region)
+        return screenshot
+
+    def close(self) -> None:
+        self.recorder.close()
+        self.inner.close()
+
+
+def open_frame_source(path: str, loop: bool = False) -> FrameSource:
+    """ArchiveSource for a recorded archive directory, PngDirectorySource for a directory of images."""
+    if os.path.isfile(os.path.join(path, ARCHIVE_INDEX)):
+        return ArchiveSource(path, loop)
+    if os.path.isdir(path):
+        return PngDirectorySource(path, loop)
+    raise FileNotFoundError(f"Frame source not found: {path}")
@@ -25,13 +25,18 @@ except ImportError:
 
     UTC = timezone.utc
 
+try:
+    import numpy as np
+except ImportError:  # pragma: nocover
+    np = None
+
 lock = Lock()
 
 
 class MSSBase(metaclass=ABCMeta):
     """This class will be overloaded by a system specific one."""
 
-    __slots__ = {"_monitors", "cls_image", "compression_level", "with_cursor"}
+    __slots__ = {"_monitors", "cls_image", "compression_level", "with_cursor", "zero_copy"}
 
     def __init__(
         self,
@@ -41,10 +46,16 @@ class MSSBase(metaclass=ABCMeta):
         display: bytes | str | None = None,  # noqa:ARG002 Linux only
         max_displays: int = 32,  # noqa:ARG002 Mac only
         with_cursor: bool = False,
+        zero_copy: bool = False,
     ) -> None:
         self.cls_image: type[ScreenShot] = ScreenShot
         self.compression_level = compression_level
         self.with_cursor = with_cursor
+        #: Return screen shots viewing a reused capture buffer instead of a copy of it, where the
+        #: platform allows it (Windows, and Linux with MIT-SHM). Such screen shots must be
+        #: released (``release()`` or ``with``) before the buffer is used for a later grab; while
+        #: one is held, grabs of that size fall back to copying.
+        self.zero_copy = zero_copy
         self._monitors: Monitors = []
 
     def __enter__(self) -> MSSBase:  # noqa:PYI034
@@ -196,47 +207,56 @@ class MSSBase(metaclass=ABCMeta):
 
     @staticmethod
     def _merge(screenshot: ScreenShot, cursor: ScreenShot, /) -> ScreenShot:
-        """Create composite image by blending screenshot and mouse cursor."""
+        """Create composite image by blending screenshot and mouse cursor.
+
+        Only the box where both overlap is touched: one array expression with NumPy, otherwise
+        slice copies for opaque rows and a loop over the visible pixels of the others.
+        """
 
         (cx, cy), (cw, ch) = cursor.pos, cursor.size
         (x, y), (w, h) = screenshot.pos, screenshot.size
 
-        cx2, cy2 = cx + cw, cy + ch
-        x2, y2 = x + w, y + h
+        left, top = max(cx, x), max(cy, y)
+        right, bottom = min(cx + cw, x + w), min(cy + ch, y + h)
+        if left >= right or top >= bottom:
+            return screenshot
 
-        overlap = cx < x2 and cx2 > x and cy < y2 and cy2 > y
-        if not overlap:
+        if np is not None:
+            screen = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(h, w, 4)
+            screen = screen[top - y : bottom - y, left - x : right - x, :3]
+            pointer = np.frombuffer(cursor.raw, dtype=np.uint8).reshape(ch, cw, 4)
+            pointer = pointer[top - cy : bottom - cy, left - cx : right - cx]
+            alpha = pointer[..., 3:].astype(np.uint16)
+            blend = pointer[..., :3] * alpha + screen * (255 - alpha)
+            screen[...] = blend // 255
             return screenshot
 
         screen_raw = screenshot.raw
         cursor_raw = cursor.raw
+        span = (right - left) * 4
 
-        cy, cy2 = (cy - y) * 4, (cy2 - y2) * 4
-        cx, cx2 = (cx - x) * 4, (cx2 - x2) * 4
-        start_count_y = -cy if cy < 0 else 0
-        start_count_x = -cx if cx < 0 else 0
-        stop_count_y = ch * 4 - max(cy2, 0)
-        stop_count_x = cw * 4 - max(cx2, 0)
-        rgb = range(3)
+        for row in range(top, bottom):
+            spos = ((row - y) * w + left - x) * 4
+            cpos = ((row - cy) * cw + left - cx) * 4
+            alphas = cursor_raw[cpos + 3 : cpos + span : 4]
 
-        for count_y in range(start_count_y, stop_count_y, 4):
-            pos_s = (count_y + cy) * w + cx
-            pos_c = count_y * cw
+            if not any(alphas):
+                continue
 
-            for count_x in range(start_count_x, stop_count_x, 4):
-                spos = pos_s + count_x
-                cpos = pos_c + count_x
-                alpha = cursor_raw[cpos + 3]
+            if alphas.count(255) == len(alphas):
+                for i in range(3):
+                    screen_raw[spos + i : spos + span : 4] = cursor_raw[cpos + i : cpos + span : 4]
+                continue
 
+            for count, alpha in enumerate(alphas):
                 if not alpha:
                     continue
-
+                s, c = spos + count * 4, cpos + count * 4
                 if alpha == 255:
-                    screen_raw[spos : spos + 3] = cursor_raw[cpos : cpos + 3]
+                    screen_raw[s : s + 3] = cursor_raw[c : c + 3]
                 else:
-                    alpha2 = alpha / 255
-                    for i in rgb:
-                        screen_raw[spos + i] = int(cursor_raw[cpos + i] * alpha2 + screen_raw[spos + i] * (1 - alpha2))
+                    for i in range(3):
+                        screen_raw[s + i] = (cursor_raw[c + i] * alpha + screen_raw[s + i] * (255 - alpha)) // 255
 
         return screenshot
 
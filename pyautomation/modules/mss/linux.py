@@ -42,6 +42,15 @@ __all__ = ("MSS",)
 PLAINMASK = 0x00FFFFFF
 ZPIXMAP = 2
 
+# System V shared memory, see shmget(2) and shmctl(2)
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+SHM_FAILED = c_void_p(-1).value
+
+# Shared memory images kept attached per thread, one per capture size
+SHM_MAX_IMAGES = 4
+
 
 class Display(Structure):
     """Structure that serves as the connection to the X server
@@ -110,6 +119,20 @@ class XImage(Structure):
     )
 
 
+class XShmSegmentInfo(Structure):
+    """Shared memory segment shared with the X server.
+    /usr/include/X11/extensions/XShm.h
+    https://gitlab.freedesktop.org/xorg/lib/libxext/-/blob/master/include/X11/extensions/XShm.h#L88.
+    """
+
+    _fields_ = (
+        ("shmseg", c_ulong),  # resource id
+        ("shmid", c_int),  # kernel id
+        ("shmaddr", c_void_p),  # address in client
+        ("readOnly", c_int),  # how the server should attach it
+    )
+
+
 class XRRCrtcInfo(Structure):
     """Structure that contains CRTC information.
     https://gitlab.freedesktop.org/xorg/lib/libxrandr/-/blob/master/include/X11/extensions/Xrandr.h#L360.
@@ -185,8 +208,10 @@ class XWindowAttributes(Structure):
 
 _ERROR = {}
 _X11 = find_library("X11")
+_XEXT = find_library("Xext")
 _XFIXES = find_library("Xfixes")
 _XRANDR = find_library("Xrandr")
+_LIBC = find_library("c")
 
 
 @CFUNCTYPE(c_int, POINTER(Display), POINTER(XErrorEvent))
@@ -228,7 +253,7 @@ def _validate(retval: int, func: Any, args: Tuple[Any, Any], /) -> Tuple[Any, An
 # C functions that will be initialised later.
 # See https://tronche.com/gui/x/xlib/function-index.html for details.
 #
-# Available attr: xfixes, xlib, xrandr.
+# Available attr: xext, xfixes, xlib, xrandr.
 #
 # Note: keep it sorted by cfunction.
 CFUNCTIONS: CFunctions = {
@@ -251,15 +276,26 @@ CFUNCTIONS: CFunctions = {
     "XRRGetScreenResources": ("xrandr", [POINTER(Display), POINTER(Display)], POINTER(XRRScreenResources)),
     "XRRGetScreenResourcesCurrent": ("xrandr", [POINTER(Display), POINTER(Display)], POINTER(XRRScreenResources)),
     "XSetErrorHandler": ("xlib", [c_void_p], c_void_p),
+    "XShmAttach": ("xext", [POINTER(Display), POINTER(XShmSegmentInfo)], c_int),
+    "XShmCreateImage": (
+        "xext",
+        [POINTER(Display), c_void_p, c_uint, c_int, c_void_p, POINTER(XShmSegmentInfo), c_uint, c_uint],
+        POINTER(XImage),
+    ),
+    "XShmDetach": ("xext", [POINTER(Display), POINTER(XShmSegmentInfo)], c_int),
+    "XShmGetImage": ("xext", [POINTER(Display), POINTER(Display), POINTER(XImage), c_int, c_int, c_ulong], c_int),
+    "XShmQueryExtension": ("xext", [POINTER(Display)], c_int),
+    "XSync": ("xlib", [POINTER(Display), c_int], c_int),
 }
 
 
 class MSS(MSSBase):
     """Multiple ScreenShots implementation for GNU/Linux.
     It uses intensively the Xlib and its Xrandr extension.
+    Grabs go through MIT-SHM shared memory when the server supports it, XGetImage otherwise.
     """
 
-    __slots__ = {"xfixes", "xlib", "xrandr", "_handles"}
+    __slots__ = {"xext", "xfixes", "xlib", "xrandr", "_handles", "_libc"}
 
     def __init__(self, /, **kwargs: Any) -> None:
         """GNU/Linux initialisations."""
@@ -271,6 +307,9 @@ class MSS(MSSBase):
         self._handles.drawable = None
         self._handles.original_error_handler = None
         self._handles.root = None
+        self._handles.shm_enabled = False
+        self._handles.shm_images = {}
+        self._handles.shm_leased = set()
 
         display = kwargs.get("display", b"")
         if not display:
@@ -297,6 +336,18 @@ class MSS(MSSBase):
             raise ScreenShotError(msg)
         self.xrandr = cdll.LoadLibrary(_XRANDR)
 
+        if _XEXT and _LIBC:
+            self.xext = cdll.LoadLibrary(_XEXT)
+            self._libc = cdll.LoadLibrary(_LIBC)
+            self._libc.shmget.argtypes = [c_int, c_ulong, c_int]
+            self._libc.shmget.restype = c_int
+            self._libc.shmat.argtypes = [c_int, c_void_p, c_int]
+            self._libc.shmat.restype = c_void_p
+            self._libc.shmdt.argtypes = [c_void_p]
+            self._libc.shmdt.restype = c_int
+            self._libc.shmctl.argtypes = [c_int, c_int, c_void_p]
+            self._libc.shmctl.restype = c_int
+
         if self.with_cursor:
             if _XFIXES:
                 self.xfixes = cdll.LoadLibrary(_XFIXES)
@@ -323,6 +374,8 @@ class MSS(MSSBase):
         #     expected LP_Display instance instead of LP_XWindowAttributes
         self._handles.drawable = cast(self._handles.root, POINTER(Display))
 
+        self._handles.shm_enabled = self._is_shm_available()
+
     def close(self) -> None:
         # Remove our error handler
         if self._handles.original_error_handler:
@@ -335,6 +388,13 @@ class MSS(MSSBase):
             self._handles.original_error_handler = None
 
         # Clean-up
+        shm_images = getattr(self._handles, "shm_images", {})
+        shm_leased = getattr(self._handles, "shm_leased", set())
+        for key, (ximage, shminfo) in shm_images.items():
+            # A segment still viewed by an unreleased zero-copy screen shot stays mapped
+            self._destroy_shm_image(ximage, shminfo, unmap=key not in shm_leased)
+        shm_images.clear()
+
         if self._handles.display:
             self.xlib.XCloseDisplay(self._handles.display)
             self._handles.display = None
@@ -363,10 +423,21 @@ class MSS(MSSBase):
                 return False
             return True
 
+    def _is_shm_available(self) -> bool:
+        """Return True if shared memory grabs can be used with this display."""
+        if not hasattr(self, "xext") or not self._is_extension_enabled("MIT-SHM"):
+            return False
+        try:
+            self.xext.XShmQueryExtension(self._handles.display)
+        except ScreenShotError:
+            return False
+        return True
+
     def _set_cfunctions(self) -> None:
         """Set all ctypes functions and attach them to attributes."""
         cfactory = self._cfactory
         attrs = {
+            "xext": getattr(self, "xext", None),
             "xfixes": getattr(self, "xfixes", None),
             "xlib": self.xlib,
             "xrandr": self.xrandr,
@@ -417,8 +488,116 @@ class MSS(MSSBase):
             xrandr.XRRFreeCrtcInfo(crtc)
         xrandr.XRRFreeScreenResources(mon)
 
+    def _create_shm_image(self, width: int, height: int, /) -> Tuple[Any, XShmSegmentInfo]:
+        """Create an XImage backed by a new shared memory segment attached to the server."""
+        display = self._handles.display
+        gwa = XWindowAttributes()
+        self.xlib.XGetWindowAttributes(display, self._handles.root, byref(gwa))
+
+        shminfo = XShmSegmentInfo()
+        ximage = self.xext.XShmCreateImage(display, gwa.visual, gwa.depth, ZPIXMAP, None, byref(shminfo), width, height)
+        if not ximage:
+            msg = "XShmCreateImage() failed"
+            raise ScreenShotError(msg)
+
+        shminfo.shmid = self._libc.shmget(IPC_PRIVATE, ximage.contents.bytes_per_line * height, IPC_CREAT | 0o600)
+        if shminfo.shmid < 0:
+            self.xlib.XDestroyImage(ximage)
+            msg = "shmget() failed"
+            raise ScreenShotError(msg)
+
+        address = self._libc.shmat(shminfo.shmid, None, 0)
+        if address is None or address == SHM_FAILED:
+            self._libc.shmctl(shminfo.shmid, IPC_RMID, None)
+            self.xlib.XDestroyImage(ximage)
+            msg = "shmat() failed"
+            raise ScreenShotError(msg)
+        shminfo.shmaddr = ximage.contents.data = address
+        shminfo.readOnly = 0
+
+        try:
+            self.xext.XShmAttach(display, byref(shminfo))
+            # Attach errors are reported asynchronously (e.g. BadAccess on a remote display)
+            self.xlib.XSync(display, 0)
+        except ScreenShotError:
+            self.xlib.XDestroyImage(ximage)
+            self._libc.shmdt(address)
+            raise
+        finally:
+            # The segment is freed once both the server and we have detached from it
+            self._libc.shmctl(shminfo.shmid, IPC_RMID, None)
+
+        return ximage, shminfo
+
+    def _destroy_shm_image(self, ximage: Any, shminfo: XShmSegmentInfo, /, *, unmap: bool = True) -> None:
+        with suppress(ScreenShotError):
+            self.xext.XShmDetach(self._handles.display, byref(shminfo))
+        with suppress(ScreenShotError):
+            self.xlib.XDestroyImage(ximage)
+        if unmap:
+            self._libc.shmdt(shminfo.shmaddr)
+
+    def _shm_image(self, width: int, height: int, /) -> Any:
+        """Return the shared memory XImage for a capture size, creating it on first use.
+
+        Images of the most recently used sizes stay attached, so repeated grabs of the same
+        monitor or region reuse one segment.
+        """
+        images = self._handles.shm_images
+        entry = images.pop((width, height), None)
+        if entry is None:
+            entry = self._create_shm_image(width, height)
+            # Evict the least recently used sizes, never a segment lent to a zero-copy screen shot
+            evictable = [key for key in images if key not in self._handles.shm_leased]
+            while len(images) >= SHM_MAX_IMAGES and evictable:
+                self._destroy_shm_image(*images.pop(evictable.pop(0)))
+        images[(width, height)] = entry
+        return entry[0]
+
+    def _grab_shm(self, monitor: Monitor, /) -> ScreenShot:
+        """Retrieve all pixels from a monitor through a reused shared memory segment."""
+        try:
+            ximage = self._shm_image(monitor["width"], monitor["height"])
+        except ScreenShotError:
+            # The server cannot use our segments (e.g. a remote display): stop trying
+            self._handles.shm_enabled = False
+            raise
+
+        self.xext.XShmGetImage(
+            self._handles.display,
+            self._handles.drawable,
+            ximage,
+            monitor["left"],
+            monitor["top"],
+            PLAINMASK,
+        )
+
+        bits_per_pixel = ximage.contents.bits_per_pixel
+        if bits_per_pixel != 32 or ximage.contents.bytes_per_line != monitor["width"] * 4:
+            self._handles.shm_enabled = False
+            msg = f"[XShmImage] bits per pixel value not (yet?) implemented: {bits_per_pixel}."
+            raise ScreenShotError(msg)
+
+        raw_data = cast(
+            ximage.contents.data,
+            POINTER(c_ubyte * monitor["height"] * monitor["width"] * 4),
+        )
+        if not self.zero_copy:
+            return self.cls_image(bytearray(raw_data.contents), monitor)
+
+        # Zero-copy: the screen shot views the segment, which is not grabbed into until released
+        key = (monitor["width"], monitor["height"])
+        leased = self._handles.shm_leased
+        leased.add(key)
+        return self.cls_image(memoryview(raw_data.contents).cast("B"), monitor, release=lambda: leased.discard(key))
+
     def _grab_impl(self, monitor: Monitor, /) -> ScreenShot:
         """Retrieve all pixels from a monitor. Pixels have to be RGB."""
+        if self._handles.shm_enabled and (monitor["width"], monitor["height"]) not in self._handles.shm_leased:
+            with suppress(ScreenShotError):
+                return self._grab_shm(monitor)
+            # Fall through: XGetImage reports errors such as an out-of-screen region properly
+
         ximage = self.xlib.XGetImage(
             self._handles.display,
             self._handles.drawable,
@@ -3,11 +3,16 @@ Source: https://github.com/BoboTiG/python-..mss.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 from ..mss.exception import ScreenShotError
 from ..mss.models import Monitor, Pixel, Pixels, Pos, Size
 
+try:
+    import numpy as np
+except ImportError:  # pragma: nocover
+    np = None
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
@@ -21,16 +26,28 @@ class ScreenShot:
         with PIL.Image, it has been decided to use *ScreenShot*.
     """
 
-    __slots__ = {"__pixels", "__rgb", "pos", "raw", "size"}
-
-    def __init__(self, data: bytearray, monitor: Monitor, /, *, size: Size | None = None) -> None:
+    __slots__ = {"__pixels", "__release", "__rgb", "pos", "raw", "size"}
+
+    def __init__(
+        self,
+        data: bytearray | memoryview,
+        monitor: Monitor,
+        /,
+        *,
+        size: Size | None = None,
+        release: Callable[[], None] | None = None,
+    ) -> None:
         self.__pixels: Pixels | None = None
         self.__rgb: bytes | None = None
 
         #: Bytearray of the raw BGRA pixels retrieved by ctypes
         #: OS independent implementations.
+        #: With ``zero_copy`` grabs it is a memoryview on a buffer owned by the MSS instance.
         self.raw = data
 
+        #: Called once by release() to hand a borrowed buffer back to its owner.
+        self.__release = release
+
         #: NamedTuple of the screen shot coordinates.
         self.pos = Pos(monitor["left"], monitor["top"])
 
@@ -40,10 +57,16 @@ class ScreenShot:
     def __repr__(self) -> str:
         return f"<{type(self).__name__} pos={self.left},{self.top} size={self.width}x{self.height}>"
 
+    def __enter__(self) -> ScreenShot:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.release()
+
     @property
     def __array_interface__(self) -> Dict[str, Any]:
         """Numpy array interface support.
-        It uses raw data in BGRA form.
+        It uses raw data in BGRA form, without copying it.
 
         See https://docs.scipy.org/doc/numpy/reference/arrays.interface.html
         """
@@ -51,9 +74,48 @@ class ScreenShot:
             "version": 3,
             "shape": (self.height, self.width, 4),
             "typestr": "|u1",
-            "data": self.raw,
+            "data": self._data(),
         }
 
+    def __buffer__(self, flags: int, /) -> memoryview:
+        """Buffer protocol support (Python 3.12+): ``memoryview(screenshot)``."""
+        return memoryview(self._data())
+
+    @property
+    def buffer(self) -> memoryview:
+        """A memoryview on the raw BGRA pixels, without copying them."""
+        return memoryview(self._data())
+
+    @property
+    def released(self) -> bool:
+        return self.raw is None
+
+    def release(self) -> None:
+        """Hand the pixel buffer back to its owner; the screen shot cannot be read afterwards.
+
+        Zero-copy screen shots borrow a buffer that the MSS instance reuses for a later grab once
+        it is released. Arrays or memoryviews taken from it must not be used after this call.
+        For other screen shots this only drops the pixels.
+        """
+        if self.raw is None:
+            return
+        self.raw = None
+        self.__pixels = None
+        self.__rgb = None
+        release, self.__release = self.__release, None
+        if release is not None:
+            release()
+
+    def copy(self) -> ScreenShot:
+        """An independent screen shot owning a copy of the pixels, to keep beyond release()."""
+        return type(self)(bytearray(self._data()), {"left": self.left, "top": self.top, "width": self.width, "height": self.height})
+
+    def _data(self) -> bytearray | memoryview:
+        if self.raw is None:
+            msg = "The screen shot has been released."
+            raise ScreenShotError(msg)
+        return self.raw
+
     @classmethod
     def from_size(cls: type[ScreenShot], data: bytearray, width: int, height: int, /) -> ScreenShot:
         """Instantiate a new class given only screen shot's data and size."""
@@ -63,7 +125,7 @@ class ScreenShot:
     @property
     def bgra(self) -> bytes:
         """BGRA values from the BGRA raw pixels."""
-        return bytes(self.raw)
+        return bytes(self._data())
 
     @property
     def height(self) -> int:
@@ -77,9 +139,14 @@ class ScreenShot:
 
     @property
     def pixels(self) -> Pixels:
-        """:return list: RGB tuples."""
+        """:return list: RGB tuples.
+
+        Builds one Python tuple per pixel, so it is slow and large on big screen shots; prefer
+        pixel(), rgb, rgb_array or to_numpy() unless the nested lists themselves are needed.
+        """
         if not self.__pixels:
-            rgb_tuples: Iterator[Pixel] = zip(self.raw[2::4], self.raw[1::4], self.raw[::4])
+            raw = self._data()
+            rgb_tuples: Iterator[Pixel] = zip(raw[2::4], raw[1::4], raw[::4])
             self.__pixels = list(zip(*[iter(rgb_tuples)] * self.width))
 
         return self.__pixels
@@ -92,7 +159,7 @@ class ScreenShot:
         """
         if not self.__rgb:
             rgb = bytearray(self.height * self.width * 3)
-            raw = self.raw
+            raw = self._data()
             rgb[::3] = raw[2::4]
             rgb[1::3] = raw[1::4]
             rgb[2::3] = raw[::4]
@@ -117,8 +184,41 @@ class ScreenShot:
         :param int coord_y: The y coordinate.
         :return tuple: The pixel value as (R, G, B).
         """
-        try:
-            return self.pixels[coord_y][coord_x]
-        except IndexError as exc:
+        if not (0 <= coord_x < self.width and 0 <= coord_y < self.height):
             msg = f"Pixel location ({coord_x}, {coord_y}) is out of range."
-            raise ScreenShotError(msg) from exc
+            raise ScreenShotError(msg)
+
+        raw = self._data()
+        offset = (coord_y * self.width + coord_x) * 4
+        return raw[offset + 2], raw[offset + 1], raw[offset]
+
+    def to_numpy(self) -> Any:
+        """The BGRA pixels as a (height, width, 4) uint8 NumPy array viewing ``raw``, without copying."""
+        return _numpy().frombuffer(self._data(), dtype=_numpy().uint8).reshape(self.height, self.width, 4)
+
+    @property
+    def rgb_array(self) -> Any:
+        """The RGB pixels as a (height, width, 3) NumPy array.
+
+        It is a strided view on ``raw`` (channels reversed, alpha skipped), not a copy: call
+        ``.copy()`` on it for a contiguous array that outlives release().
+        """
+        return self.to_numpy()[..., 2::-1]
+
+    @property
+    def gray(self) -> Any:
+        """Luma of the pixels as a (height, width) uint8 NumPy array.
+
+        BT.601 weights in 14-bit fixed point, (4899 R + 9617 G + 1868 B) / 2**14, as in OpenCV's BGRA2GRAY.
+        """
+        # Widen before multiplying: NumPy 1.x would keep uint8 * scalar products in uint16.
+        bgr = self.to_numpy()[..., :3].astype(_numpy().uint32)
+        luma = bgr[..., 0] * 1868 + bgr[..., 1] * 9617 + bgr[..., 2] * 4899 + (1 << 13)
+        return (luma >> 14).astype(_numpy().uint8)
+
+
+def _numpy() -> Any:
+    if np is None:
+        msg = "NumPy is required for array access to screen shots."
+        raise ScreenShotError(msg)
+    return np
@@ -107,6 +107,8 @@ class MSS(MSSBase):
         self._handles = local()
         self._handles.region_width_height = (0, 0)
         self._handles.bmp = None
+        self._handles.data = None
+        self._handles.leased_data = None
         self._handles.srcdc = self.user32.GetWindowDC(0)
         self._handles.memdc = self.gdi32.CreateCompatibleDC(self._handles.srcdc)
 
@@ -222,6 +224,11 @@ class MSS(MSSBase):
         is "no" color table, so we can read the pixels of the bitmap
         retrieved by gdi32.GetDIBits() as a sequence of RGB values.
         Thanks to http://stackoverflow.com/a/3688682
+
+
+        [4] With zero_copy, GetDIBits() writes into a buffer that is reused for every grab of
+            the same size, and the screen shot views it directly. While a screen shot still
+            holds the buffer, the next grab moves to a fresh buffer instead of overwriting it.
         """
         srcdc, memdc = self._handles.srcdc, self._handles.memdc
         gdi = self.gdi32
@@ -232,18 +239,34 @@ class MSS(MSSBase):
             self._handles.bmi.bmiHeader.biWidth = width
             self._handles.bmi.bmiHeader.biHeight = -height  # Why minus? [1]
             self._handles.data = ctypes.create_string_buffer(width * height * 4)  # [2]
+            self._handles.leased_data = None
             if self._handles.bmp:
                 gdi.DeleteObject(self._handles.bmp)
             self._handles.bmp = gdi.CreateCompatibleBitmap(srcdc, width, height)
             gdi.SelectObject(memdc, self._handles.bmp)
 
+        if self.zero_copy and self._handles.leased_data is self._handles.data:
+            # Still held by an unreleased screen shot: grab into a fresh buffer [4]
+            self._handles.data = ctypes.create_string_buffer(width * height * 4)
+
         gdi.BitBlt(memdc, 0, 0, width, height, srcdc, monitor["left"], monitor["top"], SRCCOPY | CAPTUREBLT)
         bits = gdi.GetDIBits(memdc, self._handles.bmp, 0, height, self._handles.data, self._handles.bmi, DIB_RGB_COLORS)
         if bits != height:
             msg = "gdi32.GetDIBits() failed."
             raise ScreenShotError(msg)
 
-        return self.cls_image(bytearray(self._handles.data), monitor)
+        if not self.zero_copy:
+            return self.cls_image(bytearray(self._handles.data), monitor)
+
+        # Zero-copy: lend the buffer to the screen shot until it is released [4]
+        data = self._handles.leased_data = self._handles.data
+        handles = self._handles
+
+        def release() -> None:
+            if handles.leased_data is data:
+                handles.leased_data = None
+
+        return self.cls_image(memoryview(data).cast("B"), monitor, release=release)
 
     def _cursor_impl(self) -> ScreenShot | None:
         """Retrieve all cursor data. Pixels have to be RGB."""
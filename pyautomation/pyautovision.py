@@ -15,20 +15,70 @@ This means that the code can be freely copied and distributed, and costs nothing
 import cv2
 import numpy as np
 from .modules import mss
+from .framesource import FrameSource, FrameSourceExhausted, open_frame_source
 # import mss
 import logging
 import asyncio
-from typing import Optional, Tuple, List
+import atexit
+import hashlib
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, Set, Tuple, List, Dict, Sequence
 import aiofiles
 import yaml  # pyyaml
 import argparse
 from pydantic import BaseModel, ValidationError, field_validator
 from injector import Injector, inject, Module, singleton, provider
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from types import SimpleNamespace
 
 # Structured logging configuration
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 'template': normalized cross-correlation over a small scale pyramid, for pixel-identical assets.
+# 'features': keypoint matching + RANSAC homography, robust to rotation/perspective.
+MATCH_STRATEGIES = ('template', 'features')
+
+
+@dataclass(frozen=True)
+class DetectorSpec:
+    factory: str
+    binary: bool
+    defaults: Dict[str, Any]
+    profile: str
+
+
+# Speed/accuracy profile from `vision_benchmark --width 1280 --height 720 --cases 12` with
+# strategies [features], ratio 0.7 and min_match_count 15 (recall within 8px; detect and match are
+# mean screen-side milliseconds). Those ratio/min_match_count values suit SIFT; binary detectors
+# find fewer good matches per template, so many of their misses are hits rejected by
+# min_match_count. Relaxing to ratio 0.8 / min_match_count 8 raised their found rate to 0.75-0.92
+# but recall only to 0.5-0.58, the rest being wrong locations, so SIFT stays the default.
+DETECTORS: Dict[str, DetectorSpec] = {
+    'SIFT': DetectorSpec('SIFT_create', False, {},
+                         'recall 1.0 (identity, scale and perspective alike); detect 207 ms, match 9 ms. '
+                         '128-float descriptors; the only detector that is reliable on every transform.'),
+    'AKAZE': DetectorSpec('AKAZE_create', True, {},
+                          'recall 0.25 (identity 0.5, scale 0.25, perspective 0.0); detect 137 ms, match 1 ms. '
+                          '61-byte binary descriptors; few keypoints on flat UI widgets.'),
+    'BRISK': DetectorSpec('BRISK_create', True, {},
+                          'recall 0.5 (identity 0.5, scale 0.25, perspective 0.75); detect 86 ms, match 3 ms. '
+                          '64-byte binary descriptors; template extraction is slow (39 ms).'),
+    'ORB': DetectorSpec('ORB_create', True, {'nfeatures': 5000},
+                        'recall 0.5 (identity, scale and perspective 0.5); detect 20 ms, match 3 ms. '
+                        '32-byte binary descriptors; ten times faster than SIFT, needs textured templates '
+                        'larger than ~40px (31px border).'),
+}
+MATCHERS = ('flann', 'bruteforce')
+
 
 class ConfigModel(BaseModel):
     monitor_index: int
@@ -36,6 +86,40 @@ class ConfigModel(BaseModel):
     min_match_count: int
     template_path: str
     show: bool
+    feature_cache: bool = True
+    feature_cache_size: int = 64
+    feature_cache_dir: Optional[str] = None
+    search_region: Optional[Tuple[int, int, int, int]] = None
+    search_hint: bool = False
+    hint_scales: List[float] = [1.5, 4.0]
+    strategies: List[str] = ['template', 'features']
+    template_threshold: float = 0.9
+    template_scales: Optional[List[float]] = None
+    dpi_variants: bool = True
+    template_dpi: float = 1.0
+    template_scale: Optional[float] = None
+    feature_workers: int = 0
+    tile_size: int = 1024
+    tile_overlap: int = 48
+    detector: str = 'SIFT'
+    detector_params: Dict[str, Any] = {}
+    matcher: str = 'flann'
+    reuse_buffers: bool = True
+    coarse_scale: float = 1.0
+    refine_margin: float = 0.25
+    executor_workers: int = 4
+    result_cache_size: int = 32
+    result_cache_ttl: Optional[float] = 10.0
+    all_monitors: bool = False
+    monitor_confidence: float = 0.8
+    tracking: bool = False
+    track_points: int = 100
+    track_min_confidence: float = 0.5
+    track_margin: float = 0.5
+    annotate_output: Optional[str] = None
+    annotate_max_files: int = 200
+    annotate_queue_size: int = 8
+    frame_source: Optional[str] = None
 
     @field_validator('ratio')
     def ratio_must_be_between_0_and_1(cls, v):
@@ -43,6 +127,37 @@ class ConfigModel(BaseModel):
             raise ValueError('ratio must be between 0 and 1')
         return v
 
+    @field_validator('strategies')
+    def strategies_must_be_known(cls, v):
+        unknown = set(v) - set(MATCH_STRATEGIES)
+        if unknown or not v:
+            raise ValueError(f'strategies must be a non-empty list of {MATCH_STRATEGIES}')
+        return v
+
+    @field_validator('detector')
+    def detector_must_be_known(cls, v):
+        if v not in DETECTORS:
+            raise ValueError(f'detector must be one of {list(DETECTORS)}')
+        return v
+
+    @field_validator('matcher')
+    def matcher_must_be_known(cls, v):
+        if v not in MATCHERS:
+            raise ValueError(f'matcher must be one of {MATCHERS}')
+        return v
+
+    @field_validator('coarse_scale')
+    def coarse_scale_must_be_a_downscale(cls, v):
+        if not 0 < v <= 1:
+            raise ValueError('coarse_scale must be in (0, 1]')
+        return v
+
+    @field_validator('search_region')
+    def search_region_must_have_size(cls, v):
+        if v is not None and (v[2] <= 0 or v[3] <= 0):
+            raise ValueError('search_region width and height must be positive')
+        return v
+
 
 class ConfigModule(Module):
     def __init__(self, config_path: str = None, **kwargs):
@@ -84,6 +199,537 @@ class ConfigModule(Module):
             raise
 
 
+def keypoint_array(keypoints: Sequence[cv2.KeyPoint]) -> np.ndarray:
+    """Keypoint coordinates as an (N, 2) float32 array."""
+    if not len(keypoints):
+        return np.empty((0, 2), np.float32)
+    return cv2.KeyPoint_convert(keypoints).reshape(-1, 2)
+
+
+@dataclass
+class TemplateFeatures:
+    image: np.ndarray
+    keypoints: List[cv2.KeyPoint]
+    descriptors: Optional[np.ndarray]
+    digest: str
+    points: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.points = keypoint_array(self.keypoints)
+
+
+class TemplateFeatureCache:
+    """In-process LRU of template features, backed by ``.npz`` files on disk.
+
+    Memory entries are keyed by (path, mtime, size, detector key) so a hit costs a
+    single ``stat``. Disk entries are keyed by the template content hash and the
+    detector key, and are stored next to the template unless ``cache_dir`` is set.
+    """
+
+    def __init__(self, maxsize: int = 64, cache_dir: Optional[str] = None, persist: bool = True):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.persist = persist
+        self._entries: "OrderedDict[tuple, TemplateFeatures]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def memory_key(path: str, detector_key: str) -> tuple:
+        stat = os.stat(path)
+        return os.path.abspath(path), stat.st_mtime_ns, stat.st_size, detector_key
+
+    def get(self, key: tuple) -> Optional[TemplateFeatures]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: TemplateFeatures) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def disk_path(self, template_path: str, digest: str, detector_key: str) -> str:
+        tag = hashlib.sha1(f"{digest}:{detector_key}".encode()).hexdigest()[:16]
+        directory = self.cache_dir or os.path.dirname(os.path.abspath(template_path))
+        name = os.path.basename(template_path)
+        return os.path.join(directory, f"{name}.{tag}.features.npz")
+
+    def load(self, template_path: str, digest: str, detector_key: str) -> Optional[Tuple[List[cv2.KeyPoint], Optional[np.ndarray]]]:
+        """Load persisted keypoints/descriptors, or None when absent or stale."""
+        if not self.persist:
+            return None
+        path = self.disk_path(template_path, digest, detector_key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data['digest']) != digest or str(data['detector']) != detector_key:
+                    return None
+                keypoints = self.array_to_keypoints(data['keypoints'])
+                descriptors = data['descriptors'] if data['descriptors'].size else None
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+            # A truncated or foreign file is a cache miss; save() replaces it with a good one.
+            logging.warning(f"Ignoring unreadable feature cache {path}: {e}")
+            return None
+        logging.info(f"Template features loaded from cache: {path}")
+        return keypoints, descriptors
+
+    def save(self, template_path: str, entry: TemplateFeatures, detector_key: str) -> None:
+        if not self.persist:
+            return
+        path = self.disk_path(template_path, entry.digest, detector_key)
+        descriptors = entry.descriptors if entry.descriptors is not None else np.empty((0, 0), np.float32)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # A unique name per writer: concurrent misses on executor threads share the pid.
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    digest=np.array(entry.digest),
+                    detector=np.array(detector_key),
+                    keypoints=self.keypoints_to_array(entry.keypoints),
+                    descriptors=descriptors,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write feature cache {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def keypoints_to_array(keypoints: List[cv2.KeyPoint]) -> np.ndarray:
+        return np.array(
+            [(kp.pt[0], kp.pt[1], kp.size, kp.angle, kp.response, kp.octave, kp.class_id) for kp in keypoints],
+            dtype=np.float64,
+        ).reshape(-1, 7)
+
+    @staticmethod
+    def array_to_keypoints(array: np.ndarray) -> List[cv2.KeyPoint]:
+        return [
+            cv2.KeyPoint(float(x), float(y), float(size), float(angle), float(response), int(octave), int(class_id))
+            for x, y, size, angle, response, octave, class_id in array
+        ]
+
+
+@dataclass
+class FrameFeatures:
+    """Features of a captured frame (or a window of it); points are in capture coordinates."""
+    keypoints: List[cv2.KeyPoint]
+    descriptors: Optional[np.ndarray]
+    offset: Tuple[int, int] = (0, 0)
+    points: np.ndarray = field(init=False, repr=False)
+    index: Optional[Any] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        self.points = keypoint_array(self.keypoints) + np.float32(self.offset)
+
+    @property
+    def usable(self) -> bool:
+        return self.descriptors is not None and len(self.keypoints) >= 2
+
+
+@dataclass
+class MatchResult:
+    template_path: str
+    object_center: Optional[List[int]] = None
+    object_location: Optional[np.ndarray] = None
+    score: float = 0.0
+    good_matches: int = 0
+    stage: Optional[str] = None
+    monitor_index: Optional[int] = None
+
+    @property
+    def found(self) -> bool:
+        return self.object_center is not None
+
+
+class DetectionResultCache:
+    """LRU of detection results keyed by (template, capture region, capture content hash).
+
+    A lookup against pixels identical to an earlier capture returns the earlier result, found
+    or not, without feature extraction. Any pixel change alters the hash, so stale entries are
+    never hit; ``ttl`` (seconds, None for no expiry) additionally bounds how long they are trusted.
+    """
+
+    def __init__(self, maxsize: int = 32, ttl: Optional[float] = 10.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[float, MatchResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[MatchResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, result: MatchResult) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class TrackState:
+    """An object followed between frames by optical flow; coordinates are capture-relative."""
+    location: np.ndarray
+    points: np.ndarray
+    initial_count: int
+
+
+@dataclass
+class DetectionEvent:
+    frame_index: int
+    timestamp: float
+    result: MatchResult
+
+
+def frame_thumbnail(image: np.ndarray, size: Tuple[int, int] = (64, 64)) -> np.ndarray:
+    """Area-averaged thumbnail of a frame, cheap to compare for change detection."""
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi')
+
+
+class AnnotationSink:
+    """Draws detections onto frames on a worker thread and writes them out without blocking detection.
+
+    ``output`` ending in .mp4/.avi is recorded as a video, anything else is a directory of
+    PNG frames of which only the newest ``max_files`` are kept. Frames go through a queue of
+    ``queue_size``; when it is full the frame is dropped (counted in ``dropped``) instead of
+    waiting. The worker never opens windows (GUI calls belong on the caller's thread); show
+    ``latest_frame()`` from there instead.
+    """
+
+    def __init__(self, output: str, max_files: int = 200, queue_size: int = 8, fps: float = 5.0):
+        self.output = output
+        self.video = output.lower().endswith(VIDEO_EXTENSIONS)
+        self.max_files = max_files
+        self.queue_size = queue_size
+        self.fps = fps
+        self.written = 0
+        self.dropped = 0
+        self._files: deque = deque()
+        self._writer: Optional[cv2.VideoWriter] = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._latest: Optional[np.ndarray] = None
+        if not self.video:
+            os.makedirs(output, exist_ok=True)
+        self._thread = threading.Thread(target=self.work, name='pyautovision-annotate', daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: np.ndarray, results: Sequence[MatchResult]) -> bool:
+        """Queue a copy of ``frame`` (capture buffers are reused) with its results; False when dropped."""
+        if self._queue.full():
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait((frame.copy(), list(results)))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    @staticmethod
+    def render(frame: np.ndarray, results: Sequence[MatchResult]) -> np.ndarray:
+        image = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR) if frame.ndim == 2 else frame
+        for i, result in enumerate(results):
+            color = (0, 255, 0) if result.found else (0, 0, 255)
+            label = f"{os.path.basename(result.template_path)} {result.stage or 'miss'} {result.score:.2f} ({result.good_matches})"
+            if result.found:
+                location = np.int32(result.object_location).reshape(-1, 1, 2)
+                cv2.polylines(image, [location], True, color, 3, cv2.LINE_AA)
+                x, y = location.reshape(-1, 2).min(axis=0)
+                origin = (int(x), max(int(y) - 8, 16))
+            else:
+                origin = (8, 24 + 24 * i)
+            cv2.putText(image, label, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2, cv2.LINE_AA)
+        return image
+
+    def write(self, image: np.ndarray) -> None:
+        if self.video:
+            height, width = image.shape[:2]
+            if self._writer is None:
+                self._writer = cv2.VideoWriter(self.output, cv2.VideoWriter_fourcc(*'mp4v'), self.fps, (width, height))
+                self._size = (width, height)
+            if (width, height) != self._size:
+                image = cv2.resize(image, self._size)
+            self._writer.write(image)
+        else:
+            path = os.path.join(self.output, f"frame_{self.written:06d}.png")
+            cv2.imwrite(path, image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+            self._files.append(path)
+            while len(self._files) > self.max_files:
+                old = self._files.popleft()
+                if os.path.exists(old):
+                    os.remove(old)
+        self.written += 1
+
+    def latest_frame(self, wait: bool = False) -> Optional[np.ndarray]:
+        """The most recently rendered frame, or None; with ``wait``, after the queued frames are done."""
+        if wait and self._thread.is_alive():
+            self._queue.join()
+        return self._latest
+
+    def work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    break
+                image = self.render(*item)
+                self._latest = image
+                self.write(image)
+            except Exception as e:
+                logging.warning(f"Annotation sink {self.output} failed to write a frame: {e}")
+            finally:
+                self._queue.task_done()
+        if self._writer is not None:
+            self._writer.release()
+
+    def close(self) -> None:
+        """Write the frames still queued and stop the worker."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        logging.info(f"Annotation sink {self.output}: {self.written} frames written, {self.dropped} dropped")
+
+
+_annotation_sinks: Dict[str, AnnotationSink] = {}
+_annotation_sinks_lock = threading.Lock()
+
+
+def get_annotation_sink(config: ConfigModel) -> Optional[AnnotationSink]:
+    """Process-wide sink for ``config.annotate_output``, shared by every matcher writing there.
+
+    The first config to use an output sets its ``annotate_max_files`` and ``annotate_queue_size``.
+    """
+    if not config.annotate_output:
+        return None
+    with _annotation_sinks_lock:
+        sink = _annotation_sinks.get(config.annotate_output)
+        if sink is None:
+            sink = _annotation_sinks[config.annotate_output] = AnnotationSink(
+                config.annotate_output, config.annotate_max_files, config.annotate_queue_size
+            )
+        elif (sink.max_files, sink.queue_size) != (config.annotate_max_files, config.annotate_queue_size):
+            logging.warning(
+                f"Annotation sink {config.annotate_output} already runs with max_files={sink.max_files}, "
+                f"queue_size={sink.queue_size}; ignoring {config.annotate_max_files}, {config.annotate_queue_size}"
+            )
+        return sink
+
+
+@atexit.register
+def close_annotation_sinks() -> None:
+    with _annotation_sinks_lock:
+        sinks = list(_annotation_sinks.values())
+        _annotation_sinks.clear()
+    for sink in sinks:
+        sink.close()
+
+
+# One feature cache per (cache_dir, size), shared by every matcher configured with those.
+_template_feature_caches: Dict[Tuple[Optional[str], int], TemplateFeatureCache] = {}
+_template_feature_caches_lock = threading.Lock()
+
+_monitor_scale_factors: Optional[List[float]] = None
+_dpi_scale_factors_lock = threading.Lock()
+
+
+def monitor_scale_factors() -> List[float]:
+    """Per-monitor scale factors in monitor order (empty when unavailable), read once.
+
+    On Windows they come from the per-monitor DPI API. Elsewhere they are read from the
+    program's QApplication if it already has one: Qt only supports an application on the main
+    thread and aborts without a display, so none is ever created here.
+    """
+    global _monitor_scale_factors
+    with _dpi_scale_factors_lock:
+        if _monitor_scale_factors is None:
+            try:
+                from .displayinfo import DisplayInfo, windows_scale_factors
+                if sys.platform == 'win32':
+                    factors = windows_scale_factors()
+                else:
+                    info = DisplayInfo()
+                    app = info.get_running_Qapp()
+                    if app is None:
+                        logging.info("No QApplication running, assuming a scale factor of 1.0 on every monitor")
+                    factors = info.get_scale_factor(app) if app is not None else []
+                _monitor_scale_factors = [round(f, 2) for f in factors]
+            except Exception as e:
+                logging.warning(f"Could not read display scale factors, using 1.0 only: {e}")
+                _monitor_scale_factors = []
+    return _monitor_scale_factors
+
+
+def dpi_scale_factors(factors: Optional[List[float]] = None) -> List[float]:
+    """Distinct monitor scale factors (of ``factors``, by default the live displays'), always including 1.0."""
+    return sorted({1.0, *(monitor_scale_factors() if factors is None else factors)})
+
+
+def monitor_scale_factor(monitor_index: int, factors: Optional[List[float]] = None) -> Optional[float]:
+    """Scale factor of an mss monitor (1-based), or None for monitor 0, the mixed-DPI virtual screen.
+
+    ``factors`` are per-monitor scale factors to pick from, by default the live displays'.
+    """
+    if monitor_index <= 0:
+        return None
+    if factors is None:
+        factors = monitor_scale_factors()
+    return factors[monitor_index - 1] if monitor_index <= len(factors) else 1.0
+
+
+_executors: Dict[Tuple[str, int], ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str, workers: int) -> ThreadPoolExecutor:
+    """Process-wide named thread pool of ``workers`` threads (cv2 and mss release the GIL).
+
+    Pools are keyed by name and size and live for the whole process: matchers configured with
+    another size get their own pool instead of shutting down one that other lookups are using.
+    """
+    with _executors_lock:
+        executor = _executors.get((name, workers))
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'pyautovision-{name}')
+            _executors[(name, workers)] = executor
+        return executor
+
+
+def get_feature_executor(workers: int) -> ThreadPoolExecutor:
+    """Thread pool for tiled feature extraction."""
+    return get_executor('tile', workers)
+
+
+_capture_handles = threading.local()
+
+
+class ThreadCaptureHandle:
+    """Owns one thread's mss handle and closes it when the thread ends.
+
+    The instance lives only in ``_capture_handles``, whose per-thread values are released by
+    the exiting thread itself, so close() runs on the thread that opened the handle.
+    """
+
+    def __init__(self):
+        self.sct = mss.mss(zero_copy=True)
+        # mss keeps its OS handles in a threading.local, which already reads as empty while the
+        # thread's locals are being released. This handle never leaves its thread, so pin them.
+        handles = getattr(self.sct, '_handles', None)
+        if isinstance(handles, threading.local):
+            self.sct._handles = SimpleNamespace(**vars(handles))
+
+    def __del__(self):
+        try:
+            self.sct.close()
+        except Exception:
+            pass
+
+
+def thread_capture_handle() -> Any:
+    """An mss handle owned by the calling thread, created on first use and closed when the thread ends.
+
+    mss keeps its OS handles thread-local, so a handle must be used from the thread
+    that created it. Grabs are zero-copy: screenshots view the handle's capture buffer
+    and must be released before the next grab can reuse it.
+    """
+    owner = getattr(_capture_handles, 'owner', None)
+    if owner is None:
+        owner = _capture_handles.owner = ThreadCaptureHandle()
+    return owner.sct
+
+
+class BackgroundLoop:
+    """An event loop running forever in a daemon thread, shared by the ``*_sync`` helpers."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='pyautovision-loop', daemon=True)
+        self.thread.start()
+
+    def run(self, coro: Awaitable) -> Any:
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("Cannot block on the pyautovision loop from its own thread; await the coroutine")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_background_loop: Optional[BackgroundLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def background_loop() -> BackgroundLoop:
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = BackgroundLoop()
+        return _background_loop
+
+
+def run_coroutine(coro: Awaitable, loop: Optional[asyncio.AbstractEventLoop] = None) -> Any:
+    """Block until ``coro`` finishes on ``loop`` (running in another thread) or the shared background loop."""
+    if loop is not None:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    return background_loop().run(coro)
+
+
+def tile_bounds(width: int, height: int, tile_size: int, overlap: int) -> List[Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]]:
+    """Split an image into (core, padded) boxes as (x1, y1, x2, y2); cores tile the image exactly."""
+    tiles = []
+    for y in range(0, height, tile_size):
+        for x in range(0, width, tile_size):
+            core = (x, y, min(x + tile_size, width), min(y + tile_size, height))
+            padded = (max(core[0] - overlap, 0), max(core[1] - overlap, 0),
+                      min(core[2] + overlap, width), min(core[3] + overlap, height))
+            tiles.append((core, padded))
+    return tiles
+
+
+# Last found center per (template path, monitor index), in global coordinates.
+_last_locations: Dict[Tuple[str, int], Tuple[int, int]] = {}
+
+
+def get_template_feature_cache(config: ConfigModel) -> TemplateFeatureCache:
+    """Return the process-wide template feature cache for the config's directory and size."""
+    key = (config.feature_cache_dir, config.feature_cache_size)
+    with _template_feature_caches_lock:
+        cache = _template_feature_caches.get(key)
+        if cache is None:
+            cache = _template_feature_caches[key] = TemplateFeatureCache(config.feature_cache_size, config.feature_cache_dir)
+        return cache
+
+
 @dataclass
 class ImageMatcher:
     config: ConfigModel
@@ -99,17 +745,65 @@ class ImageMatcher:
     monitor_shift_left: int = field(init=False, default=0)
     monitor_shift_top: int = field(init=False, default=0)
 
+    match_stage: Optional[str] = field(init=False, default=None)
+    screen_features: Optional[FrameFeatures] = field(init=False, default=None)
+    coarse_features: Optional[FrameFeatures] = field(init=False, default=None, repr=False)
+    sct: Optional[Any] = field(init=False, default=None, repr=False)
+    timings: Dict[str, float] = field(init=False, default_factory=dict)
+    gray_buffer: Optional[np.ndarray] = field(init=False, default=None, repr=False)
+    thread_state: threading.local = field(init=False, default_factory=threading.local, repr=False)
+    capture_digest: Optional[str] = field(init=False, default=None, repr=False)
+    result_cache: DetectionResultCache = field(init=False, repr=False)
+    monitor_matchers: Dict[int, "ImageMatcher"] = field(init=False, default_factory=dict, repr=False)
+    inflight: Set[Future] = field(init=False, default_factory=set, repr=False)
+
 
     @inject
     def __post_init__(self):
-        pass
+        self.result_cache = DetectionResultCache(self.config.result_cache_size, self.config.result_cache_ttl)
+        if self.config.frame_source:
+            if self.config.all_monitors:
+                raise ValueError("all_monitors cannot be used when replaying a frame source; set monitor_index")
+            self.sct = open_frame_source(self.config.frame_source)
+
+    async def offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking work on the bounded stage executor, or inline when ``executor_workers`` is 0."""
+        if self.config.executor_workers <= 0:
+            return func(*args)
+        return await self.run_tracked(get_executor('stage', self.config.executor_workers), func, *args)
+
+    async def run_tracked(self, executor: ThreadPoolExecutor, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func`` on ``executor``, keeping its future in ``inflight`` until the thread is done with it.
+
+        Cancelling the awaiting task does not stop a running thread, which may still be writing
+        into this matcher's buffers; settle() waits for such leftovers.
+        """
+        future = executor.submit(func, *args)
+        self.inflight.add(future)
+        future.add_done_callback(self.inflight.discard)
+        return await asyncio.wrap_future(future)
+
+    async def settle(self) -> None:
+        """Wait for executor work left running by a cancelled lookup before reusing this matcher."""
+        pending = tuple(self.inflight)
+        if pending:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending), return_exceptions=True)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Accumulate wall time spent in a pipeline stage into ``timings`` (seconds)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
 
     async def load_image(self, path: str, grayscale: bool = True) -> np.ndarray:
         """Asynchronously load image from file."""
         async with aiofiles.open(path, mode='rb') as f:
             image_data = await f.read()
         image_array = np.frombuffer(image_data, np.uint8)
-        image = cv2.imdecode(image_array, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
+        image = await self.offload(cv2.imdecode, image_array, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
         if image is None:
             logging.error(f"Image not found at path: {path}")
             raise FileNotFoundError(f"Image not found at path: {path}")
@@ -117,64 +811,518 @@ class ImageMatcher:
         return image
 
 
-    async def capture_screen(self) -> None:
-        """Asynchronously capture the screen."""
-        with mss.mss() as sct:
-            monitor = sct.monitors[self.config.monitor_index]  # Configurable monitor index
-            # print(monitor)
-            self.monitor_shift_left = monitor['left']
-            self.monitor_shift_top = monitor['top']
-            screenshot = sct.grab(monitor)
-            img = np.array(screenshot)
-            self.screenshot_image = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            logging.info("Screen captured successfully")
+    async def load_template_features(self, path: str, scale: float = 1.0) -> TemplateFeatures:
+        """Load a template (resized by ``scale``) and its features, reusing the in-process and on-disk caches."""
+        if not self.config.feature_cache:
+            image = await self.offload(self.scale_image, await self.load_image(path), scale)
+            with self.timed('template_detect'):
+                keypoints, descriptors = await self.find_features(image)
+            return TemplateFeatures(image, keypoints, descriptors, digest='')
+
+        cache = get_template_feature_cache(self.config)
+        detector_key = self.detector_key if scale == 1.0 else f"{self.detector_key}@{scale:g}"
+        try:
+            key = cache.memory_key(path, detector_key)
+        except OSError:
+            logging.error(f"Image not found at path: {path}")
+            raise FileNotFoundError(f"Image not found at path: {path}")
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+
+        async with aiofiles.open(path, mode='rb') as f:
+            image_data = await f.read()
+
+        def decode() -> Tuple[Optional[np.ndarray], str, Optional[tuple]]:
+            image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                return None, '', None
+            digest = hashlib.sha1(image_data).hexdigest()
+            return self.scale_image(image, scale), digest, cache.load(path, digest, detector_key)
+
+        image, digest, stored = await self.offload(decode)
+        if image is None:
+            logging.error(f"Image not found at path: {path}")
+            raise FileNotFoundError(f"Image not found at path: {path}")
+        if stored is not None:
+            keypoints, descriptors = stored
+            entry = TemplateFeatures(image, keypoints, descriptors, digest)
+        else:
+            with self.timed('template_detect'):
+                keypoints, descriptors = await self.find_features(image)
+            entry = TemplateFeatures(image, keypoints, descriptors, digest)
+            await self.offload(cache.save, path, entry, detector_key)
+        cache.put(key, entry)
+        return entry
+
+    @property
+    def variant_scale(self) -> Optional[float]:
+        """Scale of the template variant for the target monitor's DPI, or None when it cannot be known.
+
+        Templates are assumed to be captured at ``template_dpi``; ``template_scale`` overrides the
+        choice. Monitor 0 spans monitors of different DPI, so it keeps the scale search instead.
+        """
+        if self.config.template_scale is not None:
+            return self.config.template_scale
+        factor = monitor_scale_factor(self.config.monitor_index, self.scale_factors()) if self.config.dpi_variants else None
+        return None if factor is None else round(factor / self.config.template_dpi, 2)
+
+    def scale_factors(self) -> List[float]:
+        """Per-monitor scale factors: those recorded with a replayed frame source, else the live displays'.
+
+        Replays never look at the host's displays, so they pick the same scales on any machine.
+        """
+        if isinstance(self.sct, FrameSource):
+            return self.sct.scale_factors
+        return monitor_scale_factors()
+
+    async def load_template(self, path: str) -> TemplateFeatures:
+        """The template variant (image and features) matching the target monitor's DPI."""
+        return await self.load_template_features(path, self.variant_scale or 1.0)
+
+    async def prepare_templates(self, templates: Sequence[str]) -> None:
+        """Precompute the variants of ``templates`` for every distinct monitor scale factor.
+
+        Variants land in the in-process and on-disk feature caches, so later lookups on any
+        monitor find theirs without resizing or detection.
+        """
+        if self.config.template_scale is not None:
+            scales = [self.config.template_scale]
+        else:
+            scales = sorted({round(f / self.config.template_dpi, 2) for f in dpi_scale_factors(self.scale_factors())})
+        for path in templates:
+            for scale in scales:
+                await self.load_template_features(path, scale)
 
     @staticmethod
-    async def find_features(image: np.ndarray) -> Tuple[List[cv2.KeyPoint], np.ndarray]:
-        sift = cv2.SIFT_create()
-        keypoints, descriptors = sift.detectAndCompute(image, None)
-        return keypoints, descriptors
+    def scale_image(image: np.ndarray, scale: float) -> np.ndarray:
+        if scale == 1.0:
+            return image
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        return cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
 
     @staticmethod
-    def match_features(des1: np.ndarray, des2: np.ndarray) -> List:
-        index_params = dict(algorithm=1, trees=5)
+    def clip_region(left: int, top: int, width: int, height: int, bounds: Dict[str, int]) -> Optional[Dict[str, int]]:
+        """Intersect a box with bounds, returning an mss monitor dict or None when empty."""
+        x1 = max(left, bounds['left'])
+        y1 = max(top, bounds['top'])
+        x2 = min(left + width, bounds['left'] + bounds['width'])
+        y2 = min(top + height, bounds['top'] + bounds['height'])
+        if x2 <= x1 or y2 <= y1:
+            return None
+        return {'left': x1, 'top': y1, 'width': x2 - x1, 'height': y2 - y1}
+
+    def search_area(self, monitor: Dict[str, int]) -> Dict[str, int]:
+        """The configured search region (relative to the monitor), or the whole monitor."""
+        if self.config.search_region is None:
+            return dict(monitor)
+        left, top, width, height = self.config.search_region
+        area = self.clip_region(monitor['left'] + left, monitor['top'] + top, width, height, monitor)
+        if area is None:
+            logging.warning(f"search_region {self.config.search_region} is outside the monitor, using the whole monitor")
+            return dict(monitor)
+        return area
+
+    def hint_regions(self, path: str, template_shape: Tuple[int, ...], area: Dict[str, int]) -> List[Dict[str, int]]:
+        """Expanding windows around the last known location of a template, smallest first."""
+        last = _last_locations.get((path, self.config.monitor_index))
+        if last is None:
+            return []
+        h, w = template_shape[:2]
+        regions = []
+        for scale in sorted(self.config.hint_scales):
+            half_w, half_h = int(w * scale), int(h * scale)
+            region = self.clip_region(last[0] - half_w, last[1] - half_h, 2 * half_w, 2 * half_h, area)
+            if region is not None and region['width'] >= w and region['height'] >= h and region not in regions and region != area:
+                regions.append(region)
+        return regions
+
+    def monitor_geometry(self) -> Dict[str, int]:
+        sct = self.sct if self.sct is not None else thread_capture_handle()
+        return dict(sct.monitors[self.config.monitor_index])
+
+    async def capture_screen(self, region: Optional[Dict[str, int]] = None) -> None:
+        """Asynchronously capture the screen, or only ``region`` (global coordinates) of it.
+
+        An explicitly set mss handle is used on the calling thread, as mss handles are bound to
+        the thread that opened them. Frame sources, which decode or copy frames, and the default
+        long-lived per-thread mss handle grab on the stage executor.
+        """
+        if self.sct is not None and not isinstance(self.sct, FrameSource):
+            self.grab_screen(self.sct, region)
+        elif self.sct is not None:
+            await self.offload(self.grab_screen, self.sct, region)
+        else:
+            await self.offload(lambda: self.grab_screen(thread_capture_handle(), region))
+
+    def grab_screen(self, sct: Any, region: Optional[Dict[str, int]] = None) -> None:
+        monitor = sct.monitors[self.config.monitor_index]  # Configurable monitor index
+        if region is None:
+            region = self.search_area(monitor)
+        self.monitor_shift_left = region['left']
+        self.monitor_shift_top = region['top']
+        with self.timed('capture'):
+            screenshot = sct.grab(region)
+            try:
+                self.screenshot_image = self.to_gray(screenshot)
+            finally:
+                screenshot.release()
+        self.screen_features = None
+        self.coarse_features = None
+        self.capture_digest = None
+        logging.info("Screen captured successfully")
+
+    def capture_key(self) -> tuple:
+        """Identifies the current capture by its origin, size and a hash of its gray pixels (computed once)."""
+        if self.capture_digest is None:
+            self.capture_digest = hashlib.sha1(np.ascontiguousarray(self.screenshot_image)).hexdigest()
+        return self.monitor_shift_left, self.monitor_shift_top, self.screenshot_image.shape, self.capture_digest
+
+    def to_gray(self, screenshot: Any) -> np.ndarray:
+        """Convert a BGRA ScreenShot to grayscale without copying the grabbed pixels.
+
+        The BGRA data is viewed in place through ``__array_interface__``. With ``reuse_buffers``
+        the gray image is written into a buffer kept across captures of the same size, so the
+        previous ``screenshot_image`` is overwritten by the next capture; copy it to keep it.
+        """
+        bgra = np.asarray(screenshot)
+        if not self.config.reuse_buffers:
+            return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
+        if self.gray_buffer is None or self.gray_buffer.shape != bgra.shape[:2]:
+            self.gray_buffer = np.empty(bgra.shape[:2], np.uint8)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=self.gray_buffer)
+
+    @property
+    def detector_spec(self) -> DetectorSpec:
+        return DETECTORS[self.config.detector]
+
+    @property
+    def detector_params(self) -> Dict[str, Any]:
+        return {**self.detector_spec.defaults, **self.config.detector_params}
+
+    @property
+    def detector_key(self) -> str:
+        """Identifies the detector and its parameters in template feature cache keys."""
+        params = ','.join(f"{k}={v}" for k, v in sorted(self.detector_params.items()))
+        return f"{self.config.detector}({params})"
+
+    def create_detector(self) -> Any:
+        return getattr(cv2, self.detector_spec.factory)(**self.detector_params)
+
+    @property
+    def detector(self) -> Any:
+        """This thread's detector instance; OpenCV feature objects are not shared between threads."""
+        detector = getattr(self.thread_state, 'detector', None)
+        if detector is None:
+            detector = self.thread_state.detector = self.create_detector()
+        return detector
+
+    def detect_and_compute(self, image: np.ndarray) -> Tuple[List[cv2.KeyPoint], np.ndarray]:
+        detector = self.detector
+        keypoints, descriptors = detector.detectAndCompute(image, None)
+        return keypoints, descriptors
+
+    async def find_features(self, image: np.ndarray) -> Tuple[List[cv2.KeyPoint], np.ndarray]:
+        return await self.offload(self.detect_and_compute, image)
+
+    def detect_tile(
+        self, image: np.ndarray, core: Tuple[int, int, int, int], padded: Tuple[int, int, int, int]
+    ) -> Tuple[List[cv2.KeyPoint], Optional[np.ndarray]]:
+        """Detect on a padded tile, keep keypoints inside its core and shift them to image coordinates."""
+        px1, py1, px2, py2 = padded
+        keypoints, descriptors = self.detect_and_compute(image[py1:py2, px1:px2])
+        if descriptors is None:
+            return [], None
+        kept, rows = [], []
+        for i, kp in enumerate(keypoints):
+            x, y = kp.pt[0] + px1, kp.pt[1] + py1
+            if core[0] <= x < core[2] and core[1] <= y < core[3]:
+                kp.pt = (x, y)
+                kept.append(kp)
+                rows.append(i)
+        return kept, descriptors[rows]
+
+    async def find_features_tiled(self, image: np.ndarray) -> Tuple[List[cv2.KeyPoint], Optional[np.ndarray]]:
+        """Extract features tile by tile on the shared thread pool and merge them."""
+        height, width = image.shape[:2]
+        tiles = tile_bounds(width, height, self.config.tile_size, self.config.tile_overlap)
+        if self.config.feature_workers <= 1 or len(tiles) == 1:
+            return await self.find_features(image)
+
+        executor = get_feature_executor(self.config.feature_workers)
+        parts = await asyncio.gather(
+            *(self.run_tracked(executor, self.detect_tile, image, core, padded) for core, padded in tiles)
+        )
+        keypoints = [kp for part_kp, _ in parts for kp in part_kp]
+        descriptors = [des for _, des in parts if des is not None and len(des)]
+        if not descriptors:
+            return [], None
+        return keypoints, np.vstack(descriptors)
+
+    def create_matcher(self) -> Any:
+        binary = self.detector_spec.binary
+        if self.config.matcher == 'bruteforce':
+            return cv2.BFMatcher(cv2.NORM_HAMMING if binary else cv2.NORM_L2)
+        if binary:
+            index_params = dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1)  # FLANN_INDEX_LSH
+        else:
+            index_params = dict(algorithm=1, trees=5)  # FLANN_INDEX_KDTREE
         search_params = dict(checks=50)
-        flann = cv2.FlannBasedMatcher(index_params, search_params)
-        matches = flann.knnMatch(des1, des2, k=2)
+        return cv2.FlannBasedMatcher(index_params, search_params)
+
+    @property
+    def matcher(self) -> Any:
+        """This thread's descriptor matcher instance."""
+        matcher = getattr(self.thread_state, 'matcher', None)
+        if matcher is None:
+            matcher = self.thread_state.matcher = self.create_matcher()
+        return matcher
+
+    def match_features(self, des1: np.ndarray, des2: np.ndarray) -> List:
+        matcher = self.matcher
+        matches = matcher.knnMatch(des1, des2, k=2)
         return matches
 
     @staticmethod
     def filter_good_matches(matches: List, ratio: float) -> List:
-        return [m for m, n in matches if m.distance < ratio * n.distance]
+        # LSH may return fewer than two neighbours for a query; those cannot pass the ratio test.
+        return [pair[0] for pair in matches if len(pair) == 2 and pair[0].distance < ratio * pair[1].distance]
+
+    def knn(self, des1: np.ndarray, frame: FrameFeatures) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Two nearest frame descriptors per template descriptor.
+
+        Returns (query indices (N,), train indices (N, 2), distances (N, 2)). With the FLANN
+        matcher the frame index is built once per capture and shared by every template; the
+        brute-force path uses ``cv2.batchDistance`` so no ``DMatch`` objects are created.
+        """
+        des2 = frame.descriptors
+        if self.config.matcher == 'flann':
+            if frame.index is None:
+                if self.detector_spec.binary:
+                    index_params = dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1)
+                else:
+                    index_params = dict(algorithm=1, trees=5)
+                frame.index = cv2.flann_Index(des2, index_params)
+            train_idx, distances = frame.index.knnSearch(des1, 2, params=dict(checks=50))
+            distances = distances.astype(np.float32)
+            if not self.detector_spec.binary:
+                np.sqrt(distances, out=distances)  # KD-tree reports squared L2
+            return np.arange(len(des1)), train_idx, distances
+
+        if self.detector_spec.binary:
+            distances, train_idx = cv2.batchDistance(des1, des2, cv2.CV_32S, normType=cv2.NORM_HAMMING, K=2)
+        else:
+            distances, train_idx = cv2.batchDistance(des1, des2, cv2.CV_32F, normType=cv2.NORM_L2, K=2)
+        if train_idx.shape[1] < 2:
+            # K is capped at the frame's descriptor count; a missing neighbour fails the ratio test
+            train_idx = np.pad(train_idx, ((0, 0), (0, 2 - train_idx.shape[1])), constant_values=-1)
+            distances = np.pad(distances, ((0, 0), (0, 2 - distances.shape[1])))
+        return np.arange(len(des1)), train_idx, distances.astype(np.float32)
+
+    @staticmethod
+    def ratio_test(query_idx: np.ndarray, train_idx: np.ndarray, distances: np.ndarray, ratio: float) -> np.ndarray:
+        """Vectorized Lowe ratio test; returns (K, 2) [template index, screen index] pairs."""
+        keep = (train_idx[:, 0] >= 0) & (train_idx[:, 1] >= 0) & (distances[:, 0] < ratio * distances[:, 1])
+        return np.column_stack((query_idx[keep], train_idx[keep, 0]))
+
+    def estimate_location(
+        self, kp1: List[cv2.KeyPoint], kp2: List[cv2.KeyPoint], good_matches: List, min_match_count: int,
+        template_shape: Tuple[int, ...]
+    ) -> Tuple[Optional[List[int]], Optional[np.ndarray], float]:
+        """Fit a homography and return (center, corners, inlier ratio) for one template."""
+        if len(good_matches) <= min_match_count:
+            logging.warning(f"Not enough matches are found - {len(good_matches)}/{min_match_count}")
+            return None, None, 0.0
+
+        src_pts = np.float32([kp1[m.queryIdx].pt for m in good_matches])
+        dst_pts = np.float32([kp2[m.trainIdx].pt for m in good_matches])
+        return self.estimate_location_from_points(src_pts, dst_pts, min_match_count, template_shape)
+
+    def estimate_location_from_points(
+        self, src_pts: np.ndarray, dst_pts: np.ndarray, min_match_count: int, template_shape: Tuple[int, ...]
+    ) -> Tuple[Optional[List[int]], Optional[np.ndarray], float]:
+        """Same as estimate_location, from (N, 2) template and screen point arrays."""
+        if len(src_pts) <= min_match_count:
+            logging.warning(f"Not enough matches are found - {len(src_pts)}/{min_match_count}")
+            return None, None, 0.0
+
+        with self.timed('ransac'):
+            M, mask = cv2.findHomography(src_pts.reshape(-1, 1, 2), dst_pts.reshape(-1, 1, 2), cv2.RANSAC, 5.0)
+        if M is None:
+            logging.warning("Homography could not be estimated")
+            return None, None, 0.0
+
+        h, w = template_shape[:2]
+        pts = np.float32([[0, 0], [0, h - 1], [w - 1, h - 1], [w - 1, 0]]).reshape(-1, 1, 2)
+        dst = cv2.perspectiveTransform(pts, M)
+
+        location = np.int32(dst)
+        center = [int((dst[0][0][0] + dst[2][0][0]) / 2) + self.monitor_shift_left,
+                  int((dst[0][0][1] + dst[2][0][1]) / 2) + self.monitor_shift_top]
+        score = float(mask.sum()) / len(src_pts) if mask is not None else 0.0
+        return center, location, score
 
     def find_object_location(
         self, kp1: List[cv2.KeyPoint], kp2: List[cv2.KeyPoint], good_matches: List, min_match_count: int
     ) -> Tuple[Optional[Tuple[int, int]], Optional[np.ndarray]]:
-        if len(good_matches) > min_match_count:
-            src_pts = np.float32([kp1[m.queryIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-            dst_pts = np.float32([kp2[m.trainIdx].pt for m in good_matches]).reshape(-1, 1, 2)
-            M, mask = cv2.findHomography(src_pts, dst_pts, cv2.RANSAC, 5.0)
-
-            h, w = self.template_image.shape[:2]
-            pts = np.float32([[0, 0], [0, h - 1], [w - 1, h - 1], [w - 1, 0]]).reshape(-1, 1, 2)
-            dst = cv2.perspectiveTransform(pts, M)
-
-            self.object_location = np.int32(dst)
-            # self.object_center = (int((dst[0][0][0] + dst[2][0][0]) / 2), int((dst[0][0][1] + dst[2][0][1]) / 2))
-            self.object_center = [int((dst[0][0][0] + dst[2][0][0]) / 2), int((dst[0][0][1] + dst[2][0][1]) / 2)]
-
-            self.object_center[0] += self.monitor_shift_left
-            self.object_center[1] += self.monitor_shift_top
-            
-        else:
-            logging.warning(f"Not enough matches are found - {len(good_matches)}/{min_match_count}")
-            self.object_location = None
-            self.object_center = None
-        # print(f"len(good_matches): {len(good_matches)}")
+        self.object_center, self.object_location, _ = self.estimate_location(
+            kp1, kp2, good_matches, min_match_count, self.template_image.shape
+        )
         return self.object_center, self.object_location
 
+    def match_template(self, template_image: np.ndarray) -> Tuple[Optional[List[int]], Optional[np.ndarray], float]:
+        """Normalized cross-correlation over the scale pyramid; returns (center, corners, best score).
+
+        When the template is already the variant for the monitor's DPI only its own scale is tried.
+        """
+        scales = self.config.template_scales or ([1.0] if self.variant_scale is not None else dpi_scale_factors(self.scale_factors()))
+        screen = self.screenshot_image
+        best_score, best_loc, best_size = -1.0, None, None
+        for scale in scales:
+            if scale == 1.0:
+                scaled = template_image
+            else:
+                interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+                scaled = cv2.resize(template_image, None, fx=scale, fy=scale, interpolation=interpolation)
+            h, w = scaled.shape[:2]
+            if h > screen.shape[0] or w > screen.shape[1] or h < 2 or w < 2:
+                continue
+            result = cv2.matchTemplate(screen, scaled, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if max_val > best_score:
+                best_score, best_loc, best_size = max_val, max_loc, (w, h)
+
+        if best_loc is None or best_score < self.config.template_threshold:
+            return None, None, max(best_score, 0.0)
+
+        (x, y), (w, h) = best_loc, best_size
+        location = np.int32([[x, y], [x, y + h - 1], [x + w - 1, y + h - 1], [x + w - 1, y]]).reshape(-1, 1, 2)
+        center = [x + (w - 1) // 2 + self.monitor_shift_left, y + (h - 1) // 2 + self.monitor_shift_top]
+        return center, location, float(best_score)
+
+    async def get_screen_features(self) -> FrameFeatures:
+        """Features of the current capture, extracted at most once per capture."""
+        if self.screen_features is None:
+            with self.timed('detect'):
+                self.screen_features = FrameFeatures(*await self.find_features_tiled(self.screenshot_image))
+        return self.screen_features
+
+    async def get_coarse_features(self) -> FrameFeatures:
+        """Features of the capture downscaled by ``coarse_scale``, in downscaled coordinates."""
+        if self.coarse_features is None:
+            with self.timed('detect'):
+                small = await self.offload(self.scale_image, self.screenshot_image, self.config.coarse_scale)
+                self.coarse_features = FrameFeatures(*await self.find_features(small))
+        return self.coarse_features
+
+    def locate_features(
+        self, template: TemplateFeatures, frame: FrameFeatures, min_match_count: int, point_scale: float = 1.0,
+        template_shape: Optional[Tuple[int, ...]] = None
+    ) -> Tuple[Optional[List[int]], Optional[np.ndarray], float, np.ndarray]:
+        """Match template features against frame features and fit the homography.
+
+        ``point_scale`` maps both point sets back to full resolution when they come from a
+        downscaled template and frame. Returns (center, corners, score, good match pairs).
+        """
+        with self.timed('match'):
+            good_matches = self.ratio_test(*self.knn(template.descriptors, frame), self.config.ratio)
+        src_pts = template.points[good_matches[:, 0]]
+        dst_pts = frame.points[good_matches[:, 1]]
+        if point_scale != 1.0:
+            src_pts, dst_pts = src_pts * point_scale, dst_pts * point_scale
+        center, location, score = self.estimate_location_from_points(
+            src_pts, dst_pts, min_match_count, template_shape or template.image.shape
+        )
+        return center, location, score, good_matches
+
+    async def locate_coarse_to_fine(
+        self, path: str, template: TemplateFeatures
+    ) -> Tuple[Optional[List[int]], Optional[np.ndarray], float, np.ndarray]:
+        """Detect on the downscaled capture, then refine in a full-resolution window around the hit.
+
+        Keypoint counts shrink with the pixel count, so the coarse stage only needs
+        ``min_match_count * coarse_scale ** 2`` matches (at least 4) to propose a window; the
+        full-resolution refinement must then reach ``min_match_count`` for a hit. A miss here
+        is not final: ``locate_in_capture`` then searches the whole capture at full resolution.
+        """
+        scale = self.config.coarse_scale
+        coarse_template = await self.load_template_features(path, scale * (self.variant_scale or 1.0))
+        coarse = await self.get_coarse_features()
+        no_match = (None, None, 0.0, np.empty((0, 2), np.int64))
+        if coarse_template.descriptors is None or not coarse.usable:
+            return no_match
+        coarse_min = max(4, int(round(self.config.min_match_count * scale * scale)))
+        center, location, score, good_matches = await self.offload(
+            self.locate_features, coarse_template, coarse, coarse_min, 1.0 / scale, template.image.shape
+        )
+        if center is None:
+            return no_match
+
+        h, w = template.image.shape[:2]
+        x1, y1 = location.reshape(-1, 2).min(axis=0)
+        x2, y2 = location.reshape(-1, 2).max(axis=0)
+        margin_x, margin_y = int(w * self.config.refine_margin), int(h * self.config.refine_margin)
+        height, width = self.screenshot_image.shape[:2]
+        x1, y1 = max(int(x1) - margin_x, 0), max(int(y1) - margin_y, 0)
+        x2, y2 = min(int(x2) + margin_x + 1, width), min(int(y2) + margin_y + 1, height)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return no_match
+
+        with self.timed('detect'):
+            window = FrameFeatures(*await self.find_features(self.screenshot_image[y1:y2, x1:x2]), offset=(x1, y1))
+        if template.descriptors is None or not window.usable:
+            return no_match
+        return await self.offload(self.locate_features, template, window, self.config.min_match_count)
+
+    async def locate_in_capture(self, path: str, template: TemplateFeatures) -> MatchResult:
+        """Run the configured strategy chain against the current capture, or reuse the result for identical pixels."""
+        cache_key = None
+        if self.config.result_cache_size > 0:
+            template_digest = template.digest or hashlib.sha1(np.ascontiguousarray(template.image)).hexdigest()
+            cache_key = (path, template_digest, template.image.shape, *self.capture_key())
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logging.info(f"Reusing cached result for {path} (unchanged capture)")
+                return cached
+
+        result = MatchResult(template_path=path)
+        for stage in self.config.strategies:
+            if stage == 'template':
+                with self.timed('correlation'):
+                    center, location, score = await self.offload(self.match_template, template.image)
+                good_matches = []
+            else:
+                center = None
+                if self.config.coarse_scale < 1.0:
+                    center, location, score, good_matches = await self.locate_coarse_to_fine(path, template)
+                    if center is None:
+                        logging.info(f"Coarse pass found no match for {path}, retrying at full resolution")
+                if center is None:
+                    frame = await self.get_screen_features()
+                    if template.descriptors is None or not frame.usable:
+                        logging.warning("No features found to match")
+                        continue
+                    center, location, score, good_matches = await self.offload(
+                        self.locate_features, template, frame, self.config.min_match_count
+                    )
+                self.good_matches = good_matches
+            if center is not None:
+                result = MatchResult(path, center, location, score, len(good_matches), stage)
+                break
+            logging.info(f"Stage '{stage}' found no match for {path} (score {score:.3f})")
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result)
+        return result
+
+    def annotate(self, results: Sequence[MatchResult]) -> None:
+        """Hand the current capture and its results to the ``annotate_output`` sink, if configured."""
+        sink = get_annotation_sink(self.config)
+        if sink is not None and self.screenshot_image is not None:
+            sink.submit(self.screenshot_image, results)
+
     def draw_object_location(self, color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 3) -> None:
-        if self.object_location is not None:
+        """Show the detection in a window and wait for a key; use ``annotate_output`` for unattended runs."""
+        if self.object_location is not None and self.screenshot_image is not None:
             input_image_bgr = cv2.cvtColor(self.screenshot_image, cv2.COLOR_GRAY2BGR)
             input_image_bgr = cv2.polylines(input_image_bgr, [self.object_location], True, color, thickness, cv2.LINE_AA)
             cv2.imshow("Template Image", self.template_image)
@@ -184,33 +1332,364 @@ class ImageMatcher:
         else:
             logging.info("No object location found to draw")
 
+    async def locate(self, path: str) -> MatchResult:
+        """Find one template, trying last-location hint windows first when enabled."""
+        await self.settle()
+        template = await self.load_template(path)
+        self.template_image = template.image
+        if self.config.all_monitors:
+            result = await self.locate_on_monitors(path)
+            if result.monitor_index is not None:
+                # The capture and corners belong to the winning monitor's matcher; draw with those.
+                winner = self.monitor_matchers[result.monitor_index]
+                self.screenshot_image = winner.screenshot_image
+                self.monitor_shift_left, self.monitor_shift_top = winner.monitor_shift_left, winner.monitor_shift_top
+            self.object_center, self.object_location = result.object_center, result.object_location
+            self.match_stage = result.stage
+            return result
+
+        regions: List[Optional[Dict[str, int]]] = [None]
+        if self.config.search_hint:
+            area = self.search_area(self.monitor_geometry())
+            regions = self.hint_regions(path, template.image.shape, area) + [area]
+
+        result = MatchResult(template_path=path)
+        for region in regions:
+            await self.capture_screen(region)
+            result = await self.locate_in_capture(path, template)
+            if result.found:
+                break
+        self.object_center, self.object_location = result.object_center, result.object_location
+        self.match_stage = result.stage
+        self.remember_location(path, self.object_center)
+        self.annotate([result])
+        return result
+
+    def monitor_matcher(self, index: int) -> "ImageMatcher":
+        """A long-lived matcher bound to one monitor, so each keeps its own capture buffers and caches."""
+        matcher = self.monitor_matchers.get(index)
+        if matcher is None:
+            # The child shares the parent's capture handle; it must not open a frame source of its own.
+            config = self.config.model_copy(update={'monitor_index': index, 'all_monitors': False, 'frame_source': None})
+            matcher = self.monitor_matchers[index] = ImageMatcher(config=config)
+            matcher.sct = self.sct
+        return matcher
+
+    async def locate_on_monitors(self, path: str) -> MatchResult:
+        """Search every physical monitor concurrently and return the best hit in global coordinates.
+
+        Each monitor is grabbed on its own (monitor 0, the whole virtual screen, is never grabbed),
+        so centers already carry that monitor's ``monitor_shift_left/top``. The first hit scoring
+        at least ``monitor_confidence`` cancels the searches still running; otherwise the best
+        hit of all monitors is returned. A monitor whose search fails is logged and skipped. A
+        cancelled monitor's matcher finishes its running stage (see settle()) before its next lookup.
+        """
+        sct = self.sct if self.sct is not None else thread_capture_handle()
+        if isinstance(sct, FrameSource):
+            # Each monitor's grab would take the next recorded frame, i.e. another moment in time.
+            raise ValueError("all_monitors cannot be used when replaying a frame source; set monitor_index")
+        indices = list(range(1, len(sct.monitors))) or [0]
+
+        async def search(index: int) -> MatchResult:
+            try:
+                return replace(await self.monitor_matcher(index).locate(path), monitor_index=index)
+            except Exception as e:
+                logging.warning(f"{path}: search on monitor {index} failed, skipping it: {e!r}")
+                return MatchResult(template_path=path)
+
+        tasks = [asyncio.ensure_future(search(index)) for index in indices]
+        best = MatchResult(template_path=path)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result.found and (not best.found or result.score > best.score):
+                    best = result
+                if best.found and best.score >= self.config.monitor_confidence:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        logging.info(f"{path}: best hit on monitor {best.monitor_index} at {best.object_center} (score {best.score:.3f})")
+        return best
+
     async def process_image(self) -> None:
-        self.template_image = await self.load_image(self.config.template_path)
+        await self.locate(self.config.template_path)
+        logging.info(f"Image processing completed (stage: {self.match_stage})")
+
+    def remember_location(self, path: str, center: Optional[List[int]]) -> None:
+        if center is not None:
+            _last_locations[(path, self.config.monitor_index)] = (center[0], center[1])
+
+    async def locate_many(self, templates: Sequence[str]) -> Dict[str, MatchResult]:
+        """Locate several templates against a single capture and one screen feature pass."""
         await self.capture_screen()
-        kp1, des1 = await self.find_features(self.template_image)
-        kp2, des2 = await self.find_features(self.screenshot_image)
-        matches = self.match_features(des1, des2)
-        self.good_matches = self.filter_good_matches(matches, self.config.ratio)
-        self.find_object_location(kp1, kp2, self.good_matches, self.config.min_match_count)
-        logging.info("Image processing completed")
-
-    async def run(self) -> None:
+
+        results = {}
+        for path in templates:
+            template = await self.load_template(path)
+            result = await self.locate_in_capture(path, template)
+            self.remember_location(path, result.object_center)
+            results[path] = result
+            logging.info(f"{path}: object center {result.object_center} (stage: {result.stage})")
+        self.annotate(list(results.values()))
+        return results
+
+    def locate_many_sync(
+        self, templates: Sequence[str], loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Dict[str, MatchResult]:
+        """Run locate_many synchronously and return the results keyed by template path."""
+        return run_coroutine(self.locate_many(templates), loop)
+
+    def start_track(self, result: MatchResult) -> Optional[TrackState]:
+        """Pick corners inside a detected object on the current capture to follow with optical flow."""
+        if not result.found:
+            return None
+        location = result.object_location.reshape(-1, 1, 2).astype(np.float32)
+        height, width = self.screenshot_image.shape[:2]
+        x1, y1 = np.clip(location.reshape(-1, 2).min(axis=0).astype(int), 0, [width, height])
+        x2, y2 = np.clip(location.reshape(-1, 2).max(axis=0).astype(int) + 1, 0, [width, height])
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return None
+        mask = np.zeros((y2 - y1, x2 - x1), np.uint8)
+        cv2.fillConvexPoly(mask, (location.reshape(-1, 2) - [x1, y1]).astype(np.int32), 255)
+        points = cv2.goodFeaturesToTrack(
+            self.screenshot_image[y1:y2, x1:x2], self.config.track_points, 0.01, 5, mask=mask
+        )
+        if points is None or len(points) < 8:
+            return None
+        points = points + np.float32([x1, y1])
+        return TrackState(location, points, len(points))
+
+    def track_step(self, path: str, state: TrackState, previous: np.ndarray, current: np.ndarray) -> Optional[MatchResult]:
+        """Follow a tracked object into the current frame with pyramidal Lucas-Kanade flow.
+
+        Flow runs only in a window of ``track_margin`` object sizes around the last location. Points
+        failing a forward-backward check are dropped, a similarity transform is fitted to the rest and
+        applied to the corners. Returns None when fewer than ``track_min_confidence`` of the initial
+        points remain consistent, which asks the caller to re-detect.
+        """
+        with self.timed('track'):
+            height, width = current.shape[:2]
+            corners = state.location.reshape(-1, 2)
+            extent = corners.max(axis=0) - corners.min(axis=0)
+            margin = extent * self.config.track_margin + 8
+            x1, y1 = np.clip((corners.min(axis=0) - margin).astype(int), 0, [width, height])
+            x2, y2 = np.clip((corners.max(axis=0) + margin).astype(int) + 1, 0, [width, height])
+            if x2 - x1 < 8 or y2 - y1 < 8:
+                return None
+
+            offset = np.float32([x1, y1])
+            before, after = previous[y1:y2, x1:x2], current[y1:y2, x1:x2]
+            points = state.points - offset
+            moved, status, _ = cv2.calcOpticalFlowPyrLK(before, after, points, None, winSize=(21, 21), maxLevel=3)
+            back, back_status, _ = cv2.calcOpticalFlowPyrLK(after, before, moved, None, winSize=(21, 21), maxLevel=3)
+            error = np.linalg.norm((back - points).reshape(-1, 2), axis=1)
+            keep = (status.ravel() == 1) & (back_status.ravel() == 1) & (error < 1.0)
+            if keep.sum() < 4:
+                return None
+
+            M, inliers = cv2.estimateAffinePartial2D(points[keep], moved[keep], method=cv2.RANSAC, ransacReprojThreshold=3.0)
+            if M is None:
+                return None
+            inliers = inliers.ravel().astype(bool)
+            confidence = float(inliers.sum()) / state.initial_count
+            if confidence < self.config.track_min_confidence:
+                return None
+
+            location = cv2.transform(state.location - offset, M) + offset
+            state.location = location
+            state.points = moved[keep][inliers] + offset
+
+        center = location.reshape(-1, 2).mean(axis=0)
+        center = [int(center[0]) + self.monitor_shift_left, int(center[1]) + self.monitor_shift_top]
+        return MatchResult(path, center, location.astype(np.int32), confidence, int(inliers.sum()), 'track')
+
+    async def watch(
+        self, templates: Optional[Sequence[str]] = None, fps: float = 5.0, skip_unchanged: bool = True,
+        max_frames: Optional[int] = None
+    ) -> AsyncIterator[DetectionEvent]:
+        """Capture at up to ``fps`` and yield a DetectionEvent per template for every new frame.
+
+        The mss handle(s) and template features stay warm for the whole watch. Frames whose
+        thumbnail is identical to the previous one are skipped when ``skip_unchanged`` is set.
+        Capturing is pull-driven: nothing is grabbed while the consumer is still handling the
+        previous event, and ticks missed meanwhile are dropped instead of replayed. Stops after
+        ``max_frames`` captures when given.
+
+        With ``tracking`` enabled, a detected object is followed into later frames by optical
+        flow (``track_step``, a few milliseconds) and fully re-detected only when tracking is lost.
+        """
+        templates = list(templates) if templates is not None else [self.config.template_path]
+        features = {path: await self.load_template(path) for path in templates}
+        interval = 1.0 / fps if fps > 0 else 0.0
+        previous = None
+        tracks: Dict[str, Optional[TrackState]] = {}
+        previous_frame: Optional[np.ndarray] = None
+        frame_index = 0
+        next_tick = time.monotonic()
+        while max_frames is None or frame_index < max_frames:
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_tick = max(next_tick + interval, time.monotonic())
+
+            try:
+                await self.capture_screen()
+            except FrameSourceExhausted:
+                logging.info(f"Frame source exhausted after {frame_index} frames")
+                return
+            frame_index += 1
+            if skip_unchanged:
+                thumbnail = frame_thumbnail(self.screenshot_image)
+                if previous is not None and np.array_equal(thumbnail, previous):
+                    continue
+                previous = thumbnail
+
+            timestamp = time.time()
+            frame_results = []
+            tracked_frame = previous_frame is not None and previous_frame.shape == self.screenshot_image.shape
+            for path, template in features.items():
+                self.template_image = template.image
+                result = None
+                if tracks.get(path) is not None and tracked_frame:
+                    result = await self.offload(self.track_step, path, tracks[path], previous_frame, self.screenshot_image)
+                    if result is None:
+                        logging.info(f"Tracking lost for {path}, re-detecting")
+                if result is None:
+                    result = await self.locate_in_capture(path, template)
+                    if self.config.tracking:
+                        tracks[path] = await self.offload(self.start_track, result)
+                self.remember_location(path, result.object_center)
+                frame_results.append(result)
+                yield DetectionEvent(frame_index, timestamp, result)
+            self.annotate(frame_results)
+
+            if self.config.tracking:
+                # screenshot_image is overwritten by the next capture, so keep a copy for the flow.
+                if previous_frame is None or previous_frame.shape != self.screenshot_image.shape:
+                    previous_frame = self.screenshot_image.copy()
+                else:
+                    np.copyto(previous_frame, self.screenshot_image)
+
+    async def run(self, show: bool = True) -> None:
         await self.process_image()
         logging.info(f"Object center: {self.object_center}")
 
-        if self.config.show:
+        if show:
+            self.show_result()
+
+    def show_result(self) -> None:
+        """With ``show``, draw the detection, or show the ``annotate_output`` sink's latest frame without waiting for a key."""
+        if not self.config.show:
+            return
+        sink = get_annotation_sink(self.config)
+        if sink is None:
             self.draw_object_location()
+            return
+        image = sink.latest_frame(wait=True)
+        if image is not None:
+            cv2.imshow("Detected Object", image)
+            cv2.waitKey(1)
+
+    def run_sync(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Run the async method synchronously on ``loop`` or the shared background event loop.
 
-    def run_sync(self):
-        """Run the async method synchronously using an event loop."""
-        asyncio.run(self.run())
+        The detection window is shown on the calling thread: GUI calls must not run on the loop's
+        thread, and waiting there for a key would block every other ``*_sync`` lookup.
+        """
+        run_coroutine(self.run(show=False), loop)
+        self.show_result()
 
-    def get_object_location_sync(self):
+    def get_object_location_sync(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """Run the async method synchronously and return the object location."""
-        asyncio.run(self.run())
+        self.run_sync(loop)
         return self.object_center, self.object_location
 
 
+class MatcherSession:
+    """Long-lived lookup context that pays the setup cost once.
+
+    The validated config, ImageMatcher instances (with their detector/matcher objects and
+    capture buffers), the per-thread mss handles and the template caches all stay alive
+    between lookups, so ``locate`` only does the matching work::
+
+        session = MatcherSession(monitor_index=1, min_match_count=15)
+        result = session.locate('imgs/ok_button.png', ratio=0.8)
+
+    Keyword overrides apply to a single call. Matchers are pooled per distinct override
+    set, so concurrent lookups from one event loop do not share per-capture state.
+    """
+
+    def __init__(self, config_path: str = None, loop: Optional[asyncio.AbstractEventLoop] = None, **kwargs):
+        self.config: ConfigModel = Injector([ConfigModule(config_path=config_path, **kwargs)]).get(ConfigModel)
+        self.loop = loop
+        self._configs: Dict[tuple, ConfigModel] = {}
+        self._idle: Dict[tuple, List[ImageMatcher]] = {}
+
+    @staticmethod
+    def override_key(overrides: Dict[str, Any]) -> tuple:
+        return tuple(sorted((k, repr(v)) for k, v in overrides.items()))
+
+    def config_for(self, overrides: Dict[str, Any]) -> Tuple[tuple, ConfigModel]:
+        key = self.override_key(overrides)
+        config = self._configs.get(key)
+        if config is None:
+            config = self.config if not overrides else ConfigModel(**{**self.config.model_dump(), **overrides})
+            self._configs[key] = config
+        return key, config
+
+    def acquire(self, overrides: Dict[str, Any]) -> Tuple[tuple, ImageMatcher]:
+        key, config = self.config_for(overrides)
+        idle = self._idle.setdefault(key, [])
+        matcher = idle.pop() if idle else ImageMatcher(config=config)
+        matcher.timings.clear()
+        return key, matcher
+
+    def release(self, key: tuple, matcher: ImageMatcher) -> None:
+        self._idle[key].append(matcher)
+
+    async def locate_async(self, template_path: str, **overrides) -> MatchResult:
+        key, matcher = self.acquire(overrides)
+        try:
+            return await matcher.locate(template_path)
+        finally:
+            self.release(key, matcher)
+
+    async def locate_many_async(self, templates: Sequence[str], **overrides) -> Dict[str, MatchResult]:
+        key, matcher = self.acquire(overrides)
+        try:
+            return await matcher.locate_many(templates)
+        finally:
+            self.release(key, matcher)
+
+    def prepare(self, templates: Sequence[str], **overrides) -> None:
+        """Precompute the DPI variants of ``templates`` before the first lookup."""
+        key, matcher = self.acquire(overrides)
+        try:
+            run_coroutine(matcher.prepare_templates(templates), self.loop)
+        finally:
+            self.release(key, matcher)
+
+    def locate(self, template_path: str, **overrides) -> MatchResult:
+        """Locate one template synchronously."""
+        return run_coroutine(self.locate_async(template_path, **overrides), self.loop)
+
+    def locate_many(self, templates: Sequence[str], **overrides) -> Dict[str, MatchResult]:
+        """Locate several templates against one capture synchronously."""
+        return run_coroutine(self.locate_many_async(templates, **overrides), self.loop)
+
+    def close(self) -> None:
+        self._idle.clear()
+        self._configs.clear()
+
+    def __enter__(self) -> "MatcherSession":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
 def parse_args(path) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Image Matcher Configuration")
     parser.add_argument('--config', type=str, help='Path to the configuration file', default=path)
@@ -233,5 +1712,12 @@ def image_matcher(path=None, **kwargs):
     matcher.run_sync()
     return matcher
 
+def image_matcher_many(templates: Sequence[str], path=None, **kwargs) -> Dict[str, MatchResult]:
+    args = parse_args(path)
+    injector = Injector([ConfigModule(config_path=args.config, **kwargs)])
+    config = injector.get(ConfigModel)
+    matcher = ImageMatcher(config=config)
+    return matcher.locate_many_sync(templates)
+
 if __name__ == "__main__":
     main()
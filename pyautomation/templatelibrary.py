@@ -0,0 +1,227 @@
+"""
+pyautomation for Python 3.
+Author: iamtony.ca@gmail.com
+Source: https://github.com/changgwak/python-automation
+
+Template library for pyautovision: answers "which of these templates are on screen now".
+Descriptors of every template in a directory are quantized into a visual vocabulary, so a
+single screen feature pass shortlists candidate templates before full verification.
+
+pyautomation is shared under the MIT Licene.
+This means that the code can be freely copied and distributed, and costs nothing to use.
+"""
+
+
+import cv2
+import numpy as np
+import logging
+import os
+import tempfile
+import zipfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .pyautovision import ConfigModel, ImageMatcher, MatchResult, run_coroutine
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+INDEX_VERSION = 1
+
+
+class TemplateLibrary:
+    """Visual-vocabulary index over a directory of templates.
+
+    Every template descriptor is assigned to its nearest vocabulary word (k-means centers).
+    A template's score against a screen is the idf-weighted histogram intersection of its word
+    counts with the screen's, divided by its own weighted total: close to 1 for templates that
+    are visible. The index is persisted to ``index_path`` and refreshed incrementally: unchanged
+    templates keep their words and only new or modified files are re-extracted.
+
+        library = TemplateLibrary('imgs', config)
+        library.refresh()
+        visible = library.locate_visible_sync(top_k=10)
+    """
+
+    def __init__(
+        self, directory: str, config: ConfigModel, vocabulary_size: int = 1000, index_path: Optional[str] = None,
+        retrain_fraction: float = 0.5
+    ):
+        self.directory = directory
+        self.matcher = ImageMatcher(config=config)
+        self.vocabulary_size = vocabulary_size
+        self.index_path = index_path or os.path.join(directory, '.template_library.npz')
+        self.retrain_fraction = retrain_fraction
+
+        self.centers: Optional[np.ndarray] = None
+        self.paths: List[str] = []
+        self.stats: Dict[str, Tuple[int, int]] = {}
+        self.words: Dict[str, np.ndarray] = {}
+        self.idf: Optional[np.ndarray] = None
+        self._word_matrix: Optional[np.ndarray] = None
+        self._totals: Optional[np.ndarray] = None
+        self._center_floats: Optional[np.ndarray] = None
+        self._center_norms: Optional[np.ndarray] = None
+
+    @property
+    def binary(self) -> bool:
+        return self.matcher.detector_spec.binary
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """Template files in the directory with their (mtime_ns, size)."""
+        found = {}
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(path):
+                stat = os.stat(path)
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def load(self) -> bool:
+        """Load the persisted index; returns False when it is missing or built for another detector."""
+        if not os.path.isfile(self.index_path):
+            return False
+        try:
+            with np.load(self.index_path, allow_pickle=False) as data:
+                if int(data['version']) != INDEX_VERSION or str(data['detector']) != self.matcher.detector_key:
+                    return False
+                self.centers = data['centers']
+                self._center_floats = self._center_norms = None
+                self.paths = [str(p) for p in data['paths']]
+                self.stats = {p: (int(s[0]), int(s[1])) for p, s in zip(self.paths, data['stats'])}
+                self.words = {p: w[w >= 0] for p, w in zip(self.paths, data['words'])}
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+            logging.warning(f"Ignoring unreadable template library index {self.index_path}: {e}")
+            return False
+        self.vocabulary_size = len(self.centers)
+        self.update_weights()
+        logging.info(f"Template library loaded: {len(self.paths)} templates, {self.vocabulary_size} words")
+        return True
+
+    def save(self) -> None:
+        width = max((len(w) for w in self.words.values()), default=0)
+        words = np.full((len(self.paths), width), -1, np.int32)
+        for i, path in enumerate(self.paths):
+            words[i, :len(self.words[path])] = self.words[path]
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.index_path)), prefix=f"{os.path.basename(self.index_path)}.", suffix='.tmp'
+        )
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(
+                f,
+                version=np.array(INDEX_VERSION),
+                detector=np.array(self.matcher.detector_key),
+                centers=self.centers,
+                paths=np.array(self.paths),
+                stats=np.array([self.stats[p] for p in self.paths], np.int64).reshape(-1, 2),
+                words=words,
+            )
+        os.replace(tmp_path, self.index_path)
+
+    async def refresh(self, retrain: bool = False) -> None:
+        """Bring the index in line with the directory, re-extracting only changed templates."""
+        if self.centers is None and not retrain:
+            self.load()
+        current = self.scan()
+        changed = [p for p, stat in current.items() if self.stats.get(p) != stat]
+        removed = [p for p in self.paths if p not in current]
+        if not changed and not removed and self.centers is not None and not retrain:
+            return
+
+        retrain = retrain or self.centers is None or not len(self.centers) or len(changed) > self.retrain_fraction * max(len(current), 1)
+        descriptors = {}
+        for path in (current if retrain else changed):
+            template = await self.matcher.load_template_features(path)
+            if template.descriptors is not None:
+                descriptors[path] = template.descriptors
+        if retrain:
+            self.centers = self.train_vocabulary(list(descriptors.values()))
+            self._center_floats = self._center_norms = None
+            self.words = {}
+
+        for path in removed:
+            self.words.pop(path, None)
+        for path, des in descriptors.items():
+            self.words[path] = self.quantize(des)
+        self.paths = [p for p in current if p in self.words]
+        self.stats = {p: current[p] for p in self.paths}
+        self.update_weights()
+        self.save()
+        logging.info(f"Template library refreshed: {len(changed)} changed, {len(removed)} removed, "
+                     f"{len(self.paths)} indexed{' (vocabulary retrained)' if retrain else ''}")
+
+    def refresh_sync(self, retrain: bool = False) -> None:
+        run_coroutine(self.refresh(retrain))
+
+    def train_vocabulary(self, descriptor_sets: Sequence[np.ndarray], max_samples: int = 100000) -> np.ndarray:
+        """k-means vocabulary; binary descriptors are clustered on their unpacked bits.
+
+        Without any descriptor the vocabulary is empty and every shortlist is empty.
+        """
+        descriptor_sets = [d for d in descriptor_sets if len(d)]
+        if not descriptor_sets:
+            return np.empty((0, 0), np.uint8 if self.binary else np.float32)
+        samples = np.vstack([self.as_float(d) for d in descriptor_sets])
+        if len(samples) > max_samples:
+            samples = samples[np.random.default_rng(0).choice(len(samples), max_samples, replace=False)]
+        k = min(self.vocabulary_size, len(samples))
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 1e-3)
+        _, _, centers = cv2.kmeans(samples, k, None, criteria, 1, cv2.KMEANS_PP_CENTERS)
+        if self.binary:
+            return np.packbits(centers > 0.5, axis=1)
+        return centers.astype(np.float32)
+
+    def as_float(self, descriptors: np.ndarray) -> np.ndarray:
+        if self.binary:
+            return np.unpackbits(descriptors, axis=1).astype(np.float32)
+        return descriptors.astype(np.float32)
+
+    def quantize(self, descriptors: np.ndarray) -> np.ndarray:
+        """Nearest vocabulary word for every descriptor, as one matrix product.
+
+        ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, and ||x||^2 does not change the argmin. On unpacked
+        bits the same expression is the Hamming distance.
+        """
+        if self._center_floats is None:
+            self._center_floats = self.as_float(self.centers)
+            self._center_norms = (self._center_floats ** 2).sum(axis=1)
+        distances = self._center_norms[None, :] - 2.0 * (self.as_float(descriptors) @ self._center_floats.T)
+        return distances.argmin(axis=1).astype(np.int32)
+
+    def update_weights(self) -> None:
+        self._center_floats = self._center_norms = None
+        k = len(self.centers) if self.centers is not None else 0
+        counts = np.zeros((len(self.paths), k), np.float32)
+        for i, path in enumerate(self.paths):
+            counts[i] = np.bincount(self.words[path], minlength=k)
+        document_frequency = (counts > 0).sum(axis=0)
+        self.idf = np.log((len(self.paths) + 1) / (document_frequency + 1)).astype(np.float32) + 1.0
+        self._word_matrix = counts
+        self._totals = np.maximum(counts @ self.idf, 1e-6)
+
+    def shortlist(self, descriptors: Optional[np.ndarray], top_k: int = 10, min_score: float = 0.3) -> List[Tuple[str, float]]:
+        """Rank templates by how much of their (idf-weighted) word histogram occurs among ``descriptors``."""
+        if descriptors is None or not len(descriptors) or not self.paths or not len(self.centers):
+            return []
+        screen = np.bincount(self.quantize(descriptors), minlength=len(self.centers)).astype(np.float32)
+        scores = (np.minimum(self._word_matrix, screen) @ self.idf) / self._totals
+        order = np.argsort(-scores)[:top_k]
+        return [(self.paths[i], float(scores[i])) for i in order if scores[i] >= min_score]
+
+    async def locate_visible(self, top_k: int = 10, min_score: float = 0.3) -> Dict[str, MatchResult]:
+        """Capture once, shortlist from one screen feature pass, then verify only the shortlist."""
+        await self.refresh()
+        matcher = self.matcher
+        await matcher.capture_screen()
+        frame = await matcher.get_screen_features()
+        candidates = self.shortlist(frame.descriptors, top_k, min_score)
+        logging.info(f"Template library shortlist: {[(os.path.basename(p), round(s, 2)) for p, s in candidates]}")
+
+        results = {}
+        for path, _ in candidates:
+            template = await matcher.load_template(path)
+            result = await matcher.locate_in_capture(path, template)
+            matcher.remember_location(path, result.object_center)
+            if result.found:
+                results[path] = result
+        return results
+
+    def locate_visible_sync(self, top_k: int = 10, min_score: float = 0.3) -> Dict[str, MatchResult]:
+        return run_coroutine(self.locate_visible(top_k, min_score))
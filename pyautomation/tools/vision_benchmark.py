@@ -0,0 +1,287 @@
+"""
+Synthetic benchmark for pyautomation.pyautovision.
+
+Generates UI-like screens, pastes generated templates at known positions, scales and
+homographies, and runs ImageMatcher end to end against them without a live desktop.
+Per-stage latency, recall, center error and peak memory are reported as JSON so results
+can be compared between releases.
+
+    python -m pyautomation.tools.vision_benchmark --cases 30 --output bench.json
+    python -m pyautomation.tools.vision_benchmark --config "{detector: ORB, strategies: [features]}"
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+from injector import Injector
+
+from .. import __version__
+from .. import pyautovision as pv
+from ..modules.mss.screenshot import ScreenShot
+
+TRANSFORMS = ('identity', 'scale', 'perspective')
+SCHEMA_VERSION = 1
+
+
+def random_color(rng: np.random.Generator, low: int = 0, high: int = 256) -> Tuple[int, int, int]:
+    return tuple(int(c) for c in rng.integers(low, high, 3))
+
+
+def random_text(rng: np.random.Generator, length: int) -> str:
+    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 '
+    return ''.join(rng.choice(list(letters), length))
+
+
+def synthetic_screen(rng: np.random.Generator, width: int, height: int) -> np.ndarray:
+    """A BGR desktop-like canvas: gradient background, panels, text lines and sensor noise."""
+    gradient = np.linspace(30, 70, width, dtype=np.float32)
+    screen = np.repeat(np.repeat(gradient[None, :, None], height, axis=0), 3, axis=2).astype(np.uint8)
+
+    for _ in range(max(4, width * height // 200000)):
+        x, y = int(rng.integers(0, width - 50)), int(rng.integers(0, height - 50))
+        w, h = int(rng.integers(80, width // 3)), int(rng.integers(40, height // 3))
+        cv2.rectangle(screen, (x, y), (x + w, y + h), random_color(rng, 40, 230), -1)
+        cv2.rectangle(screen, (x, y), (x + w, y + h), random_color(rng, 0, 120), 1)
+
+    for _ in range(max(10, width * height // 40000)):
+        x, y = int(rng.integers(0, width - 100)), int(rng.integers(12, height))
+        cv2.putText(screen, random_text(rng, int(rng.integers(4, 24))), (x, y), cv2.FONT_HERSHEY_SIMPLEX,
+                    float(rng.uniform(0.35, 0.7)), random_color(rng), 1, cv2.LINE_AA)
+
+    noise = rng.integers(-3, 4, screen.shape, dtype=np.int16)
+    return np.clip(screen.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def synthetic_template(rng: np.random.Generator) -> np.ndarray:
+    """A BGR button/icon-like widget with enough texture for feature detectors."""
+    w, h = int(rng.integers(90, 260)), int(rng.integers(50, 130))
+    template = np.full((h, w, 3), random_color(rng, 150, 256), np.uint8)
+    cv2.rectangle(template, (0, 0), (w - 1, h - 1), random_color(rng, 0, 100), 2)
+    icon = int(min(w, h) * 0.3)
+    cv2.circle(template, (icon + 6, h // 2), icon, random_color(rng, 0, 200), -1)
+    cv2.line(template, (6, 6), (2 * icon + 6, h - 6), random_color(rng, 0, 200), 2)
+    cv2.putText(template, random_text(rng, 6), (2 * icon + 14, h // 2 + 6), cv2.FONT_HERSHEY_SIMPLEX,
+                0.6, random_color(rng, 0, 90), 2, cv2.LINE_AA)
+    return template
+
+
+def make_transform(
+    rng: np.random.Generator, kind: str, template_shape: Tuple[int, ...], screen_size: Tuple[int, int]
+) -> np.ndarray:
+    """A homography mapping the template into the screen, fully inside it."""
+    h, w = template_shape[:2]
+    src = np.float32([[0, 0], [0, h - 1], [w - 1, h - 1], [w - 1, 0]])
+    scale, angle, jitter = 1.0, 0.0, 0.0
+    if kind == 'scale':
+        scale = float(rng.choice([0.8, 1.25, 1.5, 1.75]))
+    elif kind == 'perspective':
+        scale, angle, jitter = float(rng.uniform(0.9, 1.3)), float(rng.uniform(-5, 5)), 0.03
+
+    rotation = cv2.getRotationMatrix2D((w / 2, h / 2), angle, scale)
+    dst = cv2.transform(src.reshape(-1, 1, 2), rotation).reshape(-1, 2)
+    dst += rng.uniform(-jitter, jitter, dst.shape).astype(np.float32) * np.float32([w, h])
+    dst -= dst.min(axis=0)
+    span = dst.max(axis=0)
+    offset = [rng.uniform(0, screen_size[0] - span[0] - 1), rng.uniform(0, screen_size[1] - span[1] - 1)]
+    dst += np.float32(offset)
+    return cv2.getPerspectiveTransform(src, dst.astype(np.float32))
+
+
+def paste(screen: np.ndarray, template: np.ndarray, homography: np.ndarray) -> None:
+    size = (screen.shape[1], screen.shape[0])
+    warped = cv2.warpPerspective(template, homography, size, flags=cv2.INTER_LINEAR)
+    mask = cv2.warpPerspective(np.full(template.shape[:2], 255, np.uint8), homography, size) > 0
+    screen[mask] = warped[mask]
+
+
+def expected_center(template_shape: Tuple[int, ...], homography: np.ndarray) -> Tuple[float, float]:
+    """Center as ImageMatcher reports it: midpoint of the projected top-left/bottom-right corners."""
+    h, w = template_shape[:2]
+    corners = cv2.perspectiveTransform(np.float32([[[0, 0]], [[w - 1, h - 1]]]), homography).reshape(-1, 2)
+    return float(corners[:, 0].mean()), float(corners[:, 1].mean())
+
+
+class SyntheticCapture:
+    """Stands in for ``mss.mss()``: serves one prepared frame as monitors 0 and 1."""
+
+    def __init__(self, screen: np.ndarray):
+        height, width = screen.shape[:2]
+        self.bgra = cv2.cvtColor(screen, cv2.COLOR_BGR2BGRA)
+        monitor = {'left': 0, 'top': 0, 'width': width, 'height': height}
+        self.monitors = [dict(monitor), dict(monitor)]
+
+    def grab(self, region: Dict[str, int]) -> ScreenShot:
+        left, top, width, height = region['left'], region['top'], region['width'], region['height']
+        crop = np.ascontiguousarray(self.bgra[top:top + height, left:left + width])
+        return ScreenShot(bytearray(crop.tobytes()), region)
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass
+class CaseResult:
+    index: int
+    transform: str
+    found: bool
+    correct: bool
+    stage: Optional[str]
+    center_error: Optional[float]
+    latency_ms: float
+    stages_ms: Dict[str, float]
+    peak_memory_bytes: int
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    return float(np.percentile(values, q)) if len(values) else None
+
+
+def summarize(results: List[CaseResult]) -> Dict[str, Any]:
+    latencies = [r.latency_ms for r in results]
+    errors = [r.center_error for r in results if r.center_error is not None]
+    stages = sorted({stage for r in results for stage in r.stages_ms})
+    summary = {
+        'cases': len(results),
+        'recall': sum(r.correct for r in results) / len(results) if results else None,
+        'found_rate': sum(r.found for r in results) / len(results) if results else None,
+        'center_error_px': {'mean': float(np.mean(errors)) if errors else None,
+                            'max': float(np.max(errors)) if errors else None},
+        'latency_ms': {'mean': float(np.mean(latencies)) if latencies else None,
+                       'p50': percentile(latencies, 50), 'p95': percentile(latencies, 95)},
+        'stages_ms': {stage: {'mean': float(np.mean([r.stages_ms.get(stage, 0.0) for r in results])),
+                              'p95': percentile([r.stages_ms.get(stage, 0.0) for r in results], 95)}
+                      for stage in stages},
+        'by_transform': {},
+    }
+    for kind in TRANSFORMS:
+        subset = [r for r in results if r.transform == kind]
+        if subset:
+            summary['by_transform'][kind] = {
+                'cases': len(subset),
+                'recall': sum(r.correct for r in subset) / len(subset),
+                'latency_ms_mean': float(np.mean([r.latency_ms for r in subset])),
+            }
+    return summary
+
+
+async def run_cases(
+    config: pv.ConfigModel, cases: int, width: int, height: int, seed: int, transforms: Sequence[str],
+    tolerance: float, workdir: str
+) -> List[CaseResult]:
+    rng = np.random.default_rng(seed)
+    results = []
+    for index in range(cases):
+        kind = transforms[index % len(transforms)]
+        screen = synthetic_screen(rng, width, height)
+        for _ in range(3):  # distractor widgets that are not the target
+            distractor = synthetic_template(rng)
+            paste(screen, distractor, make_transform(rng, 'identity', distractor.shape, (width, height)))
+        template = synthetic_template(rng)
+        homography = make_transform(rng, kind, template.shape, (width, height))
+        paste(screen, template, homography)
+        template_path = os.path.join(workdir, f'template_{index:04d}.png')
+        cv2.imwrite(template_path, template)
+
+        matcher = pv.ImageMatcher(config=config.model_copy(update={'template_path': template_path}))
+        matcher.sct = SyntheticCapture(screen)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        await matcher.process_image()
+        latency_ms = (time.perf_counter() - start) * 1000
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+
+        error = None
+        if matcher.object_center is not None:
+            ex, ey = expected_center(template.shape, homography)
+            error = float(np.hypot(matcher.object_center[0] - ex, matcher.object_center[1] - ey))
+        results.append(CaseResult(
+            index=index,
+            transform=kind,
+            found=matcher.object_center is not None,
+            correct=error is not None and error <= tolerance,
+            stage=matcher.match_stage,
+            center_error=error,
+            latency_ms=latency_ms,
+            stages_ms={stage: seconds * 1000 for stage, seconds in matcher.timings.items()},
+            peak_memory_bytes=peak,
+        ))
+    return results
+
+
+def run_benchmark(
+    config: pv.ConfigModel, cases: int = 20, width: int = 1920, height: int = 1080, seed: int = 0,
+    transforms: Sequence[str] = TRANSFORMS, tolerance: float = 8.0
+) -> Dict[str, Any]:
+    """Run the synthetic benchmark and return a JSON-serializable report.
+
+    Peak memory is measured with tracemalloc around each lookup (excluding the synthetic
+    scene setup), so it covers Python and NumPy allocations but not OpenCV's internal buffers.
+    """
+    with tempfile.TemporaryDirectory(prefix='pyautovision-bench-') as workdir:
+        config = config.model_copy(update={'feature_cache_dir': workdir})
+        tracemalloc.start()
+        try:
+            results = asyncio.run(run_cases(config, cases, width, height, seed, transforms, tolerance, workdir))
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'environment': {
+            'pyautomation': __version__,
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'parameters': {'cases': cases, 'screen': [width, height], 'seed': seed,
+                       'transforms': list(transforms), 'tolerance_px': tolerance},
+        'config': config.model_dump(exclude={'template_path', 'feature_cache_dir'}),
+        'peak_memory_bytes': max((r.peak_memory_bytes for r in results), default=0),
+        'summary': summarize(results),
+        'results': [asdict(r) for r in results],
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic pyautovision benchmark")
+    parser.add_argument('--config', type=str, default=None, help='YAML file or YAML string with ConfigModel overrides')
+    parser.add_argument('--cases', type=int, default=20)
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--transforms', type=str, default=','.join(TRANSFORMS))
+    parser.add_argument('--tolerance', type=float, default=8.0, help='Max center error (px) counted as a hit')
+    parser.add_argument('--output', type=str, default=None, help='Write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    config = Injector([pv.ConfigModule(config_path=args.config)]).get(pv.ConfigModel)
+    transforms = [t for t in args.transforms.split(',') if t in TRANSFORMS]
+    report = run_benchmark(config, args.cases, args.width, args.height, args.seed, transforms, args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
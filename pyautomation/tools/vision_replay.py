@@ -0,0 +1,163 @@
+"""
+Record and replay screen sessions for pyautomation.pyautovision.
+
+``record`` grabs a monitor at a fixed rate into a frame archive (see pyautomation.framesource).
+``replay`` runs ImageMatcher over an archive, or a directory of screenshots, as fast as it can
+and reports throughput, per-stage timings and every detection as JSON. The same archive gives
+the same input on any machine, display or not, so reports can be diffed between detectors,
+configs and commits.
+
+    python -m pyautomation.tools.vision_replay record session --frames 200 --fps 5 --monitor 1
+    python -m pyautomation.tools.vision_replay replay session --templates imgs/ok.png imgs/cancel.png
+    python -m pyautomation.tools.vision_replay replay session --templates imgs/ok.png --config "{detector: ORB}"
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import cv2
+import numpy as np
+from injector import Injector
+
+from .. import __version__
+from .. import pyautovision as pv
+from ..framesource import RecordingSource, open_frame_source
+from ..modules import mss
+
+SCHEMA_VERSION = 1
+
+
+def record(path: str, frames: int, fps: float, monitor_index: int, color: bool = False) -> int:
+    """Grab ``frames`` captures of a monitor at up to ``fps`` into the archive at ``path``."""
+    source = RecordingSource(mss.mss(), path, color, pv.monitor_scale_factors())
+    interval = 1.0 / fps if fps > 0 else 0.0
+    monitor = source.monitors[monitor_index]
+    try:
+        next_tick = time.monotonic()
+        for _ in range(frames):
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_tick = max(next_tick + interval, time.monotonic())
+            source.grab(monitor)
+    finally:
+        source.close()
+    return frames
+
+
+async def replay_frames(config: pv.ConfigModel, templates: Sequence[str]) -> Dict[str, Any]:
+    matcher = pv.ImageMatcher(config=config)
+    detections: List[Dict[str, Any]] = []
+    frames = 0
+    start = time.perf_counter()
+    async for event in matcher.watch(templates, fps=0, skip_unchanged=False):
+        frames = event.frame_index
+        result = event.result
+        detections.append({
+            'frame': event.frame_index,
+            'template': result.template_path,
+            'center': result.object_center,
+            'stage': result.stage,
+            'score': result.score,
+        })
+    seconds = time.perf_counter() - start
+    return {
+        'frames': frames,
+        'seconds': seconds,
+        'frames_per_second': frames / seconds if seconds > 0 else None,
+        'stages_ms': {stage: total * 1000 / max(frames, 1) for stage, total in matcher.timings.items()},
+        'found': {path: sum(1 for d in detections if d['template'] == path and d['center'] is not None)
+                  for path in templates},
+        'detections': detections,
+    }
+
+
+def recorded_monitor(source: str) -> Optional[int]:
+    """Index of the monitor whose geometry matches the first recorded frame, if any."""
+    frames = open_frame_source(source)
+    try:
+        region = {k: frames.frame_region(0)[k] for k in ('left', 'top', 'width', 'height')} if len(frames) else None
+        for index, monitor in enumerate(frames.monitors):
+            if {k: monitor[k] for k in ('left', 'top', 'width', 'height')} == region:
+                return index
+        return None
+    finally:
+        frames.close()
+
+
+def replay(
+    config: pv.ConfigModel, source: str, templates: Sequence[str], monitor_index: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run every frame of ``source`` through ImageMatcher.watch and return a JSON-serializable report.
+
+    Frames are matched on ``monitor_index``, by default the monitor the source was recorded from.
+    """
+    if monitor_index is None:
+        monitor_index = recorded_monitor(source)
+    update = {'frame_source': source, 'show': False}
+    if monitor_index is not None:
+        update['monitor_index'] = monitor_index
+    config = config.model_copy(update=update)
+    report = asyncio.run(replay_frames(config, templates))
+    return {
+        'schema': SCHEMA_VERSION,
+        'environment': {
+            'pyautomation': __version__,
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'source': source,
+        'templates': list(templates),
+        'config': config.model_dump(exclude={'template_path', 'frame_source'}),
+        **report,
+    }
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Record and replay pyautovision sessions")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    recorder = commands.add_parser('record', help='Record a monitor into a frame archive')
+    recorder.add_argument('archive', type=str)
+    recorder.add_argument('--frames', type=int, default=100)
+    recorder.add_argument('--fps', type=float, default=5.0)
+    recorder.add_argument('--monitor', type=int, default=1)
+    recorder.add_argument('--color', action='store_true', help='Keep BGRA pixels instead of gray')
+
+    player = commands.add_parser('replay', help='Run the matcher over a frame archive or image directory')
+    player.add_argument('source', type=str)
+    player.add_argument('--templates', type=str, nargs='+', required=True)
+    player.add_argument('--monitor', type=int, default=None, help='Monitor to match on (default: the recorded one)')
+    player.add_argument('--config', type=str, default=None, help='YAML file or YAML string with ConfigModel overrides')
+    player.add_argument('--output', type=str, default=None, help='Write the JSON report here instead of stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+    args = parse_args(argv)
+    if args.command == 'record':
+        record(args.archive, args.frames, args.fps, args.monitor, args.color)
+        return None
+
+    config = Injector([pv.ConfigModule(config_path=args.config)]).get(pv.ConfigModel)
+    report = replay(config, args.source, args.templates, args.monitor)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import random
+
+import numpy
+import pytest
+
+from pyautomation.modules.mss import base
+from pyautomation.modules.mss.base import MSSBase
+from pyautomation.modules.mss.screenshot import ScreenShot
+
+SCREEN = {"left": 100, "top": 50, "width": 12, "height": 9}
+CURSOR_W, CURSOR_H = 5, 4
+
+# Cursor origins crossing each edge and corner of SCREEN, inside it and outside it
+POSITIONS = {
+    "inside": (104, 53),
+    "left": (98, 53),
+    "right": (109, 53),
+    "top": (104, 48),
+    "bottom": (104, 57),
+    "top-left": (97, 47),
+    "top-right": (110, 48),
+    "bottom-left": (99, 58),
+    "bottom-right": (111, 58),
+    "covering": (95, 45),
+    "outside": (112, 53),
+}
+ALPHAS = {
+    "transparent": [0],
+    "opaque": [255],
+    "partial": [1, 64, 128, 254],
+    "mixed": [0, 255, 37, 200],
+}
+
+
+def make_cursor(left: int, top: int, alphas: list[int], rng: random.Random) -> ScreenShot:
+    data = bytearray()
+    for _ in range(CURSOR_W * CURSOR_H):
+        data += rng.randbytes(3) + bytes((rng.choice(alphas),))
+    return ScreenShot(data, {"left": left, "top": top, "width": CURSOR_W, "height": CURSOR_H})
+
+
+def merge(monkeypatch, screen: bytes, cursor: ScreenShot, use_numpy: bool, view: bool) -> bytes:
+    monkeypatch.setattr(base, "np", numpy if use_numpy else None)
+    raw = bytearray(screen)
+    shot = ScreenShot(memoryview(raw) if view else raw, SCREEN)
+    assert MSSBase._merge(shot, cursor) is shot
+    return bytes(raw)
+
+
+def reference(screen: bytes, cursor: ScreenShot) -> bytes:
+    """Per-pixel blend over the whole cursor, skipping pixels off the screenshot."""
+    out = bytearray(screen)
+    (cx, cy), (x, y), w = cursor.pos, (SCREEN["left"], SCREEN["top"]), SCREEN["width"]
+    for row in range(CURSOR_H):
+        for col in range(CURSOR_W):
+            sx, sy = cx + col - x, cy + row - y
+            if not (0 <= sx < w and 0 <= sy < SCREEN["height"]):
+                continue
+            c, s = (row * CURSOR_W + col) * 4, (sy * w + sx) * 4
+            alpha = cursor.raw[c + 3]
+            for i in range(3):
+                out[s + i] = (cursor.raw[c + i] * alpha + out[s + i] * (255 - alpha)) // 255
+    return bytes(out)
+
+
+@pytest.mark.parametrize("alphas", ALPHAS.values(), ids=ALPHAS.keys())
+@pytest.mark.parametrize("position", POSITIONS.values(), ids=POSITIONS.keys())
+def test_numpy_and_python_merge_agree(monkeypatch, position, alphas):
+    rng = random.Random(f"{position}{alphas}")
+    screen = rng.randbytes(SCREEN["width"] * SCREEN["height"] * 4)
+    cursor = make_cursor(*position, alphas, rng)
+    expected = reference(screen, cursor)
+
+    for view in (False, True):
+        assert merge(monkeypatch, screen, cursor, use_numpy=True, view=view) == expected
+        assert merge(monkeypatch, screen, cursor, use_numpy=False, view=view) == expected
@@ -0,0 +1,69 @@
+import random
+import struct
+import zlib
+
+import pytest
+
+from pyautomation.modules.mss import tools
+from pyautomation.modules.mss.tools import to_png
+
+
+def make_rgb(width: int, height: int, seed: int = 0) -> bytes:
+    """Noise in the top half, a flat colour below, so every level has something to compress."""
+    noise = random.Random(seed).randbytes(width * 3 * (height // 2))
+    return noise + b"\x20\x40\x60" * (width * (height - height // 2))
+
+
+def read_png(png: bytes) -> tuple[tuple[int, int], bytes, int]:
+    """(size, decompressed IDAT data, IDAT chunk count) of a PNG, checking every chunk CRC."""
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat, count, size = 8, [], 0, None
+    while pos < len(png):
+        (length,) = struct.unpack(">I", png[pos : pos + 4])
+        tag, data = png[pos + 4 : pos + 8], png[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", png[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(tag + data), tag
+        if tag == b"IHDR":
+            size = struct.unpack(">2I", data[:8])
+        elif tag == b"IDAT":
+            idat.append(data)
+            count += 1
+        pos += 12 + length
+    assert tag == b"IEND"
+    # zlib.decompress checks the header and the Adler-32 trailer
+    return size, zlib.decompress(b"".join(idat)), count
+
+
+def scanlines(data: bytes, width: int, height: int) -> bytes:
+    line = width * 3
+    return b"".join(b"\x00" + data[y * line : y * line + line] for y in range(height))
+
+
+@pytest.mark.parametrize("level", [0, 1, 6, 9, -1])
+@pytest.mark.parametrize("threads", [1, 2, 3, 8])
+def test_threaded_png_decodes_to_the_same_scanlines(level, threads):
+    width, height = 37, 29
+    data = make_rgb(width, height)
+    size, raw, _ = read_png(to_png(data, (width, height), level=level, threads=threads))
+    assert size == (width, height)
+    assert raw == scanlines(data, width, height)
+
+
+@pytest.mark.parametrize("height", [1, 2, 3])
+def test_more_threads_than_rows(height):
+    width = 5
+    data = make_rgb(width, height)
+    for level in (0, 6, 9):
+        _, raw, _ = read_png(to_png(data, (width, height), level=level, threads=16))
+        assert raw == scanlines(data, width, height)
+
+
+def test_threaded_png_spans_several_idat_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(tools, "IDAT_SIZE", 4096)
+    width, height = 64, 100
+    data = make_rgb(width, height, seed=1)
+    output = tmp_path / "shot.png"
+    assert to_png(data, (width, height), level=0, threads=4, output=str(output), fsync=True) is None
+    _, raw, count = read_png(output.read_bytes())
+    assert count > 1
+    assert raw == scanlines(data, width, height)
@@ -0,0 +1,178 @@
+"""MIT-SHM grabs of the vendored mss, checked against XGetImage on a private Xvfb server.
+
+Skipped unless Xvfb and the X11/Xrandr libraries are installed, e.g. ``apt install xvfb``.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux")
+    or shutil.which("Xvfb") is None
+    or ctypes.util.find_library("X11") is None
+    or ctypes.util.find_library("Xrandr") is None,
+    reason="needs Xvfb and the X11/Xrandr libraries",
+)
+
+WIDTH, HEIGHT = 640, 480
+RED, GREEN, BLUE = 0xFF0000, 0x00FF00, 0x0000FF
+
+
+class Painter:
+    """Fills rectangles of the root window through its own Xlib connection."""
+
+    def __init__(self, display: str):
+        xlib = self.xlib = ctypes.cdll.LoadLibrary(ctypes.util.find_library("X11"))
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XOpenDisplay.restype = ctypes.c_void_p
+        xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        xlib.XCreateGC.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_void_p]
+        xlib.XCreateGC.restype = ctypes.c_void_p
+        xlib.XSetForeground.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong]
+        xlib.XFillRectangle.argtypes = [
+            ctypes.c_void_p, ctypes.c_ulong, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_uint, ctypes.c_uint
+        ]
+        xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XFreeGC.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+
+        self.display = xlib.XOpenDisplay(display.encode())
+        assert self.display, f"cannot open {display}"
+        self.root = xlib.XDefaultRootWindow(self.display)
+        self.gc = xlib.XCreateGC(self.display, self.root, 0, None)
+
+    def fill(self, color: int, x: int, y: int, width: int, height: int) -> None:
+        self.xlib.XSetForeground(self.display, self.gc, color)
+        self.xlib.XFillRectangle(self.display, self.root, self.gc, x, y, width, height)
+        self.xlib.XSync(self.display, 0)
+
+    def close(self) -> None:
+        self.xlib.XFreeGC(self.display, self.gc)
+        self.xlib.XCloseDisplay(self.display)
+
+
+@pytest.fixture
+def xvfb(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    server = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", f"{WIDTH}x{HEIGHT}x24", "-nolisten", "tcp",
+         "+extension", "MIT-SHM", "+extension", "RANDR"],
+        pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        number = f.readline().strip()
+    if not number:
+        server.kill()
+        pytest.skip("Xvfb did not start")
+    display = f":{number}"
+    monkeypatch.setenv("DISPLAY", display)
+
+    painter = Painter(display)
+    painter.fill(BLUE, 0, 0, WIDTH, HEIGHT)
+    painter.fill(RED, 10, 10, 50, 40)
+    painter.fill(GREEN, 300, 200, 120, 90)
+    try:
+        yield painter
+    finally:
+        painter.close()
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def make_mss(**kwargs):
+    from pyautomation.modules.mss.linux import MSS
+
+    sct = MSS(**kwargs)
+    assert sct._handles.shm_enabled, "Xvfb was started with MIT-SHM"
+    return sct
+
+
+REGION = {"left": 5, "top": 5, "width": 420, "height": 300}
+
+
+def grab_xgetimage(sct, region):
+    enabled, sct._handles.shm_enabled = sct._handles.shm_enabled, False
+    try:
+        return sct.grab(region)
+    finally:
+        sct._handles.shm_enabled = enabled
+
+
+def test_shm_grab_matches_xgetimage(xvfb):
+    sct = make_mss()
+    try:
+        for region in (REGION, sct.monitors[1], {"left": 301, "top": 203, "width": 7, "height": 3}):
+            shm = sct.grab(region)
+            assert sct._handles.shm_enabled
+            assert (region["width"], region["height"]) in sct._handles.shm_images, "the grab went through XShmGetImage"
+            assert shm.rgb == grab_xgetimage(sct, region).rgb
+
+        shot = sct.grab(REGION)
+        assert shot.pixel(10, 10) == (255, 0, 0)
+        assert shot.pixel(300, 200) == (0, 255, 0)
+        assert shot.pixel(0, 0) == (0, 0, 255)
+    finally:
+        sct.close()
+
+
+def test_shm_segments_are_reused_and_bounded(xvfb):
+    from pyautomation.modules.mss.linux import SHM_MAX_IMAGES
+
+    sct = make_mss()
+    try:
+        sct.grab(REGION)
+        images = sct._handles.shm_images
+        key = (REGION["width"], REGION["height"])
+        first = ctypes.addressof(images[key][0].contents)
+
+        xvfb.fill(RED, 0, 0, 100, 100)
+        shot = sct.grab(REGION)
+        assert len(images) == 1
+        assert ctypes.addressof(images[key][0].contents) == first
+        assert shot.pixel(50, 50) == (255, 0, 0), "a reused segment holds the new pixels"
+
+        for size in range(1, SHM_MAX_IMAGES + 3):
+            sct.grab({"left": 0, "top": 0, "width": 16 * size, "height": 8 * size})
+        assert len(images) == SHM_MAX_IMAGES
+    finally:
+        sct.close()
+
+
+def test_zero_copy_lease_falls_back_to_xgetimage(xvfb):
+    from pyautomation.modules.mss.linux import SHM_MAX_IMAGES
+
+    sct = make_mss(zero_copy=True)
+    try:
+        leased = sct.grab(REGION)
+        assert isinstance(leased.raw, memoryview)
+        key = (REGION["width"], REGION["height"])
+        assert key in sct._handles.shm_leased
+        before = bytes(leased.raw)
+
+        # The leased segment is neither written by the next grab of that size nor evicted
+        xvfb.fill(GREEN, 0, 0, WIDTH, HEIGHT)
+        fallback = sct.grab(REGION)
+        assert isinstance(fallback.raw, bytearray)
+        assert fallback.pixel(0, 0) == (0, 255, 0)
+        for size in range(1, SHM_MAX_IMAGES + 3):
+            sct.grab({"left": 0, "top": 0, "width": 16 * size, "height": 8 * size}).release()
+        assert key in sct._handles.shm_images
+        assert bytes(leased.raw) == before
+        assert leased.pixel(5, 5) == (255, 0, 0)
+
+        leased.release()
+        assert key not in sct._handles.shm_leased
+        again = sct.grab(REGION)
+        assert isinstance(again.raw, memoryview)
+        assert again.pixel(5, 5) == (0, 255, 0)
+        again.release()
+    finally:
+        sct.close()
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+
+from pyautomation.pyautovision import ConfigModel, run_coroutine
+from pyautomation.templatelibrary import TemplateLibrary
+
+
+def make_config(directory) -> ConfigModel:
+    return ConfigModel(
+        monitor_index=1, ratio=0.7, min_match_count=15, template_path=str(directory), show=False,
+        feature_cache=False,
+    )
+
+
+def write_templates(directory, seed: int, count: int = 4) -> None:
+    rng = np.random.default_rng(seed)
+    for i in range(count):
+        image = np.full((160, 160), 255, np.uint8)
+        for _ in range(40):
+            x, y = (int(v) for v in rng.integers(10, 150, 2))
+            cv2.circle(image, (x, y), int(rng.integers(3, 12)), int(rng.integers(0, 200)), -1)
+        cv2.imwrite(str(directory / f"template_{i}.png"), image)
+
+
+def assert_self_match(library: TemplateLibrary) -> None:
+    for path in library.paths:
+        descriptors = run_coroutine(library.matcher.load_template_features(path)).descriptors
+        (best, score), *_ = library.shortlist(descriptors, top_k=1, min_score=0.0)
+        assert best == path
+        assert score > 0.99
+
+
+def test_retrain_after_shortlist_uses_new_vocabulary(tmp_path):
+    write_templates(tmp_path, seed=0)
+    library = TemplateLibrary(str(tmp_path), make_config(tmp_path), vocabulary_size=20)
+    library.refresh_sync()
+    assert_self_match(library)
+
+    write_templates(tmp_path, seed=1)
+    library.vocabulary_size = 50
+    library.refresh_sync()
+    assert len(library.centers) == 50
+    assert_self_match(library)
+
+    reloaded = TemplateLibrary(str(tmp_path), make_config(tmp_path))
+    assert reloaded.load()
+    assert_self_match(reloaded)
+
+
+def test_empty_directory(tmp_path):
+    library = TemplateLibrary(str(tmp_path), make_config(tmp_path))
+    library.refresh_sync()
+    assert library.paths == []
+    assert library.shortlist(np.ones((5, 128), np.float32)) == []
+
+    cv2.imwrite(str(tmp_path / "blank.png"), np.full((64, 64), 255, np.uint8))
+    library.refresh_sync()
+    assert library.paths == []
+    assert library.shortlist(np.ones((5, 128), np.float32)) == []